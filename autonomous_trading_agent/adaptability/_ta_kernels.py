@@ -0,0 +1,294 @@
+import numpy as np
+from numba import cfunc, njit, prange, types
+
+# Explicit signature so both kernels are compiled eagerly at import time and
+# the LLVM object is cached to disk, instead of paying the JIT cost on the
+# first live call. The arrays are declared readonly because pandas 3.x
+# copy-on-write hands out readonly views from to_numpy(); readonly parameters
+# accept writable arrays as well.
+_F8_RO = types.Array(types.f8, 1, 'C', readonly=True)
+_LAST_SIG = types.f8(_F8_RO, _F8_RO, _F8_RO, types.i8)
+
+
+@njit(_LAST_SIG, cache=True, boundscheck=False)
+def wilder_atr_last(high, low, close, n=14):
+    """
+    Computes the final Wilder-smoothed Average True Range value.
+
+    Runs a single pass over raw NumPy arrays and returns only the last ATR
+    value, avoiding the full-length intermediate series that ta.volatility
+    allocates.
+
+    Args:
+        high: 1-D float64 array of high prices.
+        low: 1-D float64 array of low prices.
+        close: 1-D float64 array of close prices.
+        n: The smoothing window (Wilder period). Defaults to 14.
+
+    Returns:
+        The last ATR value as a float, or NaN if there are fewer than n + 1 bars.
+    """
+    size = high.shape[0]
+    if size < n + 1:
+        return np.nan
+
+    atr = 0.0
+    for i in range(1, n + 1):
+        hl = high[i] - low[i]
+        hc = abs(high[i] - close[i - 1])
+        lc = abs(low[i] - close[i - 1])
+        # max() drops NaN operands, so screen explicitly: a NaN bar must
+        # poison the whole recursion, not silently vanish.
+        if hl != hl or hc != hc or lc != lc:
+            return np.nan
+        tr = max(hl, max(hc, lc))
+        atr += tr
+    atr /= n
+
+    for i in range(n + 1, size):
+        hl = high[i] - low[i]
+        hc = abs(high[i] - close[i - 1])
+        lc = abs(low[i] - close[i - 1])
+        if hl != hl or hc != hc or lc != lc:
+            return np.nan
+        tr = max(hl, max(hc, lc))
+        atr = (atr * (n - 1) + tr) / n
+
+    return atr
+
+
+@njit(_LAST_SIG, cache=True, boundscheck=False)
+def wilder_adx_last(high, low, close, n=14):
+    """
+    Computes the final Average Directional Index value with Wilder smoothing.
+
+    Accumulates TR, +DM and -DM in a single pass using the Wilder recursion
+    s = s - s/n + x and returns only the last ADX value, so no intermediate
+    DataFrame columns are allocated.
+
+    Args:
+        high: 1-D float64 array of high prices.
+        low: 1-D float64 array of low prices.
+        close: 1-D float64 array of close prices.
+        n: The smoothing window (Wilder period). Defaults to 14.
+
+    Returns:
+        The last ADX value as a float, or NaN if there are fewer than 2n + 1 bars.
+    """
+    size = high.shape[0]
+    if size < 2 * n + 1:
+        return np.nan
+
+    tr_s = 0.0
+    plus_dm_s = 0.0
+    minus_dm_s = 0.0
+    adx = 0.0
+    dx_count = 0
+
+    for i in range(1, size):
+        hl = high[i] - low[i]
+        hc = abs(high[i] - close[i - 1])
+        lc = abs(low[i] - close[i - 1])
+        tr = max(hl, max(hc, lc))
+
+        up_move = high[i] - high[i - 1]
+        down_move = low[i - 1] - low[i]
+        # max() drops NaN operands and NaNs fail every comparison, so the
+        # DM selection and the tr_s > 0 guard below would quietly turn a
+        # NaN bar into zeros; screen the raw differences.
+        if hl != hl or hc != hc or lc != lc or up_move != up_move or down_move != down_move:
+            return np.nan
+        plus_dm = up_move if (up_move > down_move and up_move > 0.0) else 0.0
+        minus_dm = down_move if (down_move > up_move and down_move > 0.0) else 0.0
+
+        if i <= n:
+            tr_s += tr
+            plus_dm_s += plus_dm
+            minus_dm_s += minus_dm
+        else:
+            tr_s = tr_s - tr_s / n + tr
+            plus_dm_s = plus_dm_s - plus_dm_s / n + plus_dm
+            minus_dm_s = minus_dm_s - minus_dm_s / n + minus_dm
+
+        if i >= n:
+            if tr_s > 0.0:
+                plus_di = 100.0 * plus_dm_s / tr_s
+                minus_di = 100.0 * minus_dm_s / tr_s
+                di_sum = plus_di + minus_di
+                dx = 100.0 * abs(plus_di - minus_di) / di_sum if di_sum > 0.0 else 0.0
+            else:
+                dx = 0.0
+
+            dx_count += 1
+            if dx_count <= n:
+                adx += dx
+                if dx_count == n:
+                    adx /= n
+            else:
+                adx = (adx * (n - 1) + dx) / n
+
+    return adx
+
+
+_FUSED_SIG = types.UniTuple(types.f8, 2)(_F8_RO, _F8_RO, _F8_RO, types.i8)
+
+
+@njit(_FUSED_SIG, cache=True, boundscheck=False)
+def atr_adx_last(high, low, close, n=14):
+    """
+    Computes the final ATR and ADX together in a single pass.
+
+    Fuses the true-range and directional-movement recursions into one loop so
+    the HLC arrays are read once instead of once per indicator.
+
+    Args:
+        high: 1-D float64 array of high prices.
+        low: 1-D float64 array of low prices.
+        close: 1-D float64 array of close prices.
+        n: The smoothing window (Wilder period). Defaults to 14.
+
+    Returns:
+        An (atr, adx) tuple of the last values; either element is NaN when
+        there are too few bars for its warm-up (n + 1 for ATR, 2n + 1 for ADX).
+    """
+    size = high.shape[0]
+
+    atr = 0.0
+    tr_s = 0.0
+    plus_dm_s = 0.0
+    minus_dm_s = 0.0
+    adx = 0.0
+    dx_count = 0
+
+    for i in range(1, size):
+        hl = high[i] - low[i]
+        hc = abs(high[i] - close[i - 1])
+        lc = abs(low[i] - close[i - 1])
+        tr = max(hl, max(hc, lc))
+
+        up_move = high[i] - high[i - 1]
+        down_move = low[i - 1] - low[i]
+        # Same screening as the single-indicator kernels: max() and the
+        # comparison-guarded branches would otherwise swallow NaN bars.
+        if hl != hl or hc != hc or lc != lc or up_move != up_move or down_move != down_move:
+            return np.nan, np.nan
+        plus_dm = up_move if (up_move > down_move and up_move > 0.0) else 0.0
+        minus_dm = down_move if (down_move > up_move and down_move > 0.0) else 0.0
+
+        if i <= n:
+            atr += tr
+            if i == n:
+                atr /= n
+            tr_s += tr
+            plus_dm_s += plus_dm
+            minus_dm_s += minus_dm
+        else:
+            atr = (atr * (n - 1) + tr) / n
+            tr_s = tr_s - tr_s / n + tr
+            plus_dm_s = plus_dm_s - plus_dm_s / n + plus_dm
+            minus_dm_s = minus_dm_s - minus_dm_s / n + minus_dm
+
+        if i >= n:
+            if tr_s > 0.0:
+                plus_di = 100.0 * plus_dm_s / tr_s
+                minus_di = 100.0 * minus_dm_s / tr_s
+                di_sum = plus_di + minus_di
+                dx = 100.0 * abs(plus_di - minus_di) / di_sum if di_sum > 0.0 else 0.0
+            else:
+                dx = 0.0
+
+            dx_count += 1
+            if dx_count <= n:
+                adx += dx
+                if dx_count == n:
+                    adx /= n
+            else:
+                adx = (adx * (n - 1) + dx) / n
+
+    atr_out = atr if size >= n + 1 else np.nan
+    adx_out = adx if dx_count >= n else np.nan
+    return atr_out, adx_out
+
+
+_I8_RO = types.Array(types.i8, 1, 'C', readonly=True)
+_SWEEP_SIG = types.Array(types.f8, 2, 'C')(_F8_RO, _F8_RO, _F8_RO, _I8_RO)
+
+
+@njit(_SWEEP_SIG, cache=True, parallel=True)
+def atr_adx_sweep(high, low, close, windows):
+    """
+    Computes the final ATR and ADX for a batch of smoothing windows.
+
+    Parallelizes over the window axis with prange, so one pass over the HLC
+    arrays per core amortizes across all K parameter choices instead of K
+    independent Python-level calls.
+
+    Args:
+        high: 1-D float64 array of high prices.
+        low: 1-D float64 array of low prices.
+        close: 1-D float64 array of close prices.
+        windows: 1-D int64 array of Wilder periods to evaluate.
+
+    Returns:
+        A (len(windows), 2) float64 array of (last ATR, last ADX) per window.
+    """
+    out = np.empty((windows.shape[0], 2), dtype=np.float64)
+    for k in prange(windows.shape[0]):
+        n = windows[k]
+        out[k, 0] = wilder_atr_last(high, low, close, n)
+        out[k, 1] = wilder_adx_last(high, low, close, n)
+    return out
+
+
+# fastmath is deliberately off throughout this module: a NaN anywhere in the
+# inputs must propagate through the recursions so the np.isnan guards (and
+# classify_regime_code below) can degrade to UNKNOWN instead of confidently
+# classifying contaminated data.
+_CLASSIFY_SIG = types.i8(types.f8, types.f8, types.f8, types.f8, types.f8)
+
+
+@njit(_CLASSIFY_SIG, cache=True, boundscheck=False)
+def classify_regime_code(atr, adx, close, vol_threshold, trend_threshold):
+    """
+    Classifies the market regime as an integer code.
+
+    Codes follow the RegimeCode enum in adaptability_manager: 0 = UNKNOWN
+    (any NaN input or zero close), then 1 + ((trend_bit << 1) | vol_bit) for
+    the four known regimes.
+
+    Args:
+        atr: The latest ATR value.
+        adx: The latest ADX value.
+        close: The latest close price.
+        vol_threshold: ATR/close ratio above which volatility is 'high'.
+        trend_threshold: ADX value above which the market is 'trending'.
+
+    Returns:
+        The regime code as an int64.
+    """
+    if atr != atr or adx != adx or close != close or close == 0.0:
+        return 0
+    vol_bit = 1 if atr / close > vol_threshold else 0
+    trend_bit = 1 if adx > trend_threshold else 0
+    return 1 + ((trend_bit << 1) | vol_bit)
+
+
+# C entry point for compiled consumers (other Numba kernels, Cython, ctypes):
+# classify_regime_code_cfunc.address is a plain function pointer with the
+# signature above, callable without the GIL.
+classify_regime_code_cfunc = cfunc(_CLASSIFY_SIG)(classify_regime_code.py_func)
+
+
+def _warmup():
+    """
+    Runs each kernel once on a small dummy array.
+
+    With the eager signatures above this is nearly free (compilation already
+    happened at import), but it forces the cached machine code to be loaded
+    and any lazy initialization to complete before the first live bar.
+    """
+    dummy = np.arange(32, dtype=np.float64)
+    wilder_atr_last(dummy, dummy, dummy, 14)
+    wilder_adx_last(dummy, dummy, dummy, 14)
+    atr_adx_last(dummy, dummy, dummy, 14)
+
@@ -1,9 +1,61 @@
+import math
 import pandas as pd
-import ta
 import logging
 import numpy as np
+from enum import IntEnum
+
+from ._ta_kernels import atr_adx_last, atr_adx_sweep, classify_regime_code, _warmup
+
+
+class RegimeCode(IntEnum):
+    """
+    Integer market-regime codes for the numeric decision path.
+
+    The ordering mirrors the classify_regime_code kernel: 0 for unknown,
+    then 1 + ((trend_bit << 1) | vol_bit).
+    """
+    UNKNOWN = 0
+    RANGING_LOW_VOL = 1
+    RANGING_HIGH_VOL = 2
+    TRENDING_LOW_VOL = 3
+    TRENDING_HIGH_VOL = 4
+
+
+# Strategy types referenced by index from the numeric adjustment table.
+STRATEGY_TYPES = ('hold', 'range_bound', 'trend_following')
+
+
+def _build_adjustment_codes(table):
+    """
+    Flattens the (regime, volatility) adjustment table into a (5, 4) array.
+
+    Row order follows RegimeCode; columns are risk_per_trade_multiplier,
+    stop_loss_multiplier, take_profit_multiplier and the STRATEGY_TYPES
+    index, so the numeric path never touches dicts or strings.
+    """
+    keys = (
+        (None, 'unknown'),
+        ('RANGING_LOW_VOL', 'low'),
+        ('RANGING_HIGH_VOL', 'high'),
+        ('TRENDING_LOW_VOL', 'low'),
+        ('TRENDING_HIGH_VOL', 'high'),
+    )
+    rows = []
+    for key in keys:
+        adj = table[key]
+        rows.append([
+            adj['risk_per_trade_multiplier'],
+            adj['stop_loss_multiplier'],
+            adj['take_profit_multiplier'],
+            float(STRATEGY_TYPES.index(adj['strategy_type'])),
+        ])
+    return np.array(rows, dtype=np.float64)
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Cached so the hot-path guards below are a single attribute access.
+_INFO = logging.INFO
 
 class AdaptabilityManager:
     """
@@ -13,6 +65,50 @@ class AdaptabilityManager:
     high/low volatility) and suggests adjustments to strategy parameters
     and risk management settings.
     """
+    # Columns every analysis entry point needs; frozenset so the preflight
+    # check is a single C-level set difference against data.columns.
+    _REQUIRED = frozenset(('high', 'low', 'close'))
+
+    # Regime lookup indexed by (trend_bit << 1) | vol_bit, so classification
+    # is two compares and a shift-or instead of a four-way string if/elif
+    # chain. The NaN guard upstream falls back to 'UNCERTAIN'.
+    _REGIMES = ('RANGING_LOW_VOL', 'RANGING_HIGH_VOL', 'TRENDING_LOW_VOL', 'TRENDING_HIGH_VOL')
+    _VOL_LEVELS = ('low', 'high')
+    _TREND_LEVELS = ('ranging', 'trending')
+
+    # Base adjustments per regime; the None key is the fallback for UNKNOWN or
+    # UNCERTAIN regimes.
+    _BASE_ADJUSTMENTS = {
+        'TRENDING_HIGH_VOL': {'strategy_type': 'trend_following', 'risk_per_trade_multiplier': 0.8,
+                              'stop_loss_multiplier': 1.5, 'take_profit_multiplier': 2.0},
+        'TRENDING_LOW_VOL': {'strategy_type': 'trend_following', 'risk_per_trade_multiplier': 1.0,
+                             'stop_loss_multiplier': 1.0, 'take_profit_multiplier': 1.5},
+        'RANGING_HIGH_VOL': {'strategy_type': 'range_bound', 'risk_per_trade_multiplier': 0.6,
+                             'stop_loss_multiplier': 1.8, 'take_profit_multiplier': 1.2},
+        'RANGING_LOW_VOL': {'strategy_type': 'range_bound', 'risk_per_trade_multiplier': 1.0,
+                            'stop_loss_multiplier': 1.0, 'take_profit_multiplier': 1.0},
+        None: {'strategy_type': 'hold', 'risk_per_trade_multiplier': 0.5,
+               'stop_loss_multiplier': 1.0, 'take_profit_multiplier': 1.0},
+    }
+    # Precomputed (regime, volatility) -> adjustments lookup with the
+    # high/low volatility stop-loss multiplier (1.2x/0.8x) folded in at
+    # table-build time, so suggest_strategy_adjustment is a single dict
+    # lookup at runtime.
+    # The analysis paths emit the hold fallback regime both as 'UNKNOWN' and
+    # as 'UNCERTAIN' (e.g. ATR warmed up before ADX), so the None row is
+    # expanded under those names as well — the volatility multiplier must
+    # still apply when the regime itself is unresolved.
+    _ADJUSTMENT_TABLE = {
+        (name, vol): {**base, 'stop_loss_multiplier': base['stop_loss_multiplier'] * mult}
+        for regime, base in _BASE_ADJUSTMENTS.items()
+        for name in ((None, 'UNKNOWN', 'UNCERTAIN') if regime is None else (regime,))
+        for vol, mult in (('high', 1.2), ('low', 0.8), ('unknown', 1.0))
+    }
+
+    # Numeric twin of _ADJUSTMENT_TABLE indexed by RegimeCode, for the
+    # compiled decision path.
+    _ADJUSTMENT_CODES = _build_adjustment_codes(_ADJUSTMENT_TABLE)
+
     def __init__(self, volatility_threshold: float = 0.02, trend_strength_threshold: float = 20):
         """
         Initializes the AdaptabilityManager with thresholds for market analysis.
@@ -25,7 +121,15 @@ class AdaptabilityManager:
         """
         self.volatility_threshold = volatility_threshold
         self.trend_strength_threshold = trend_strength_threshold
-        logging.info('AdaptabilityManager initialized with volatility_threshold={} and trend_strength_threshold={}.'.format(self.volatility_threshold, self.trend_strength_threshold))
+        # Small LRU-style cache for analyze_market_conditions: in streaming
+        # use the same DataFrame tail is analyzed repeatedly between bar
+        # closes, so repeated calls on unchanged data hit the cache instead
+        # of re-running the indicator kernels.
+        self._analysis_cache = {}
+        self._analysis_cache_maxsize = 64
+        self.reset_streaming_state()
+        _warmup()
+        logger.info('AdaptabilityManager initialized with volatility_threshold=%s and trend_strength_threshold=%s.', self.volatility_threshold, self.trend_strength_threshold)
 
 
     def analyze_market_conditions(self, data: pd.DataFrame) -> dict:
@@ -45,58 +149,300 @@ class AdaptabilityManager:
             and an overall 'regime' ('TRENDING_HIGH_VOL', 'RANGING_LOW_VOL', etc.,
             or 'UNKNOWN', 'UNCERTAIN').
         """
-        logging.info('Analyzing market conditions...')
         market_conditions = {}
 
         if data.empty:
-            logging.warning('Input data is empty. Cannot analyze market conditions.')
+            logger.warning('Input data is empty. Cannot analyze market conditions.')
             return {'regime': 'UNKNOWN'}
 
-        required_cols = ['high', 'low', 'close']
-        if not all(col in data.columns for col in required_cols):
-             missing = [col for col in required_cols if col not in data.columns]
-             logging.error(f'Missing required data columns for analysis: {missing}')
+        missing = self._REQUIRED.difference(data.columns)
+        if missing:
+             logger.error('Missing required data columns for analysis: %s', sorted(missing))
              return {'regime': 'UNKNOWN'}
 
+        # Key the cache on the identity, last index value and length of the
+        # DataFrame: if none of these changed, no new bar has arrived and the
+        # previous analysis is still valid.
+        cache_key = (id(data), data.index[-1], len(data))
+        cached = self._analysis_cache.get(cache_key)
+        if cached is not None:
+            return cached.copy()
+
         try:
-            data['ATR'] = ta.volatility.average_true_range(data['high'], data['low'], data['close'], window=14)
-            latest_atr = data['ATR'].iloc[-1] if not data['ATR'].empty else np.nan
-            latest_close = data['close'].iloc[-1] if not data['close'].empty else np.nan
+            # Extract each column as a contiguous 1-D view once; the kernels
+            # never see pandas objects and the caller's DataFrame is left
+            # untouched.
+            high = np.ascontiguousarray(data['high'].to_numpy(dtype=np.float64))
+            low = np.ascontiguousarray(data['low'].to_numpy(dtype=np.float64))
+            close = np.ascontiguousarray(data['close'].to_numpy(dtype=np.float64))
 
-            if not np.isnan(latest_atr) and not np.isnan(latest_close) and latest_close != 0:
-                volatility_percentage = (latest_atr / latest_close)
-                market_conditions['volatility'] = 'high' if volatility_percentage > self.volatility_threshold else 'low'
+            latest_atr, latest_adx = atr_adx_last(high, low, close, 14)
+            latest_close = close[-1] if close.size else np.nan
+
+            vol_known = not np.isnan(latest_atr) and not np.isnan(latest_close) and latest_close != 0
+            trend_known = not np.isnan(latest_adx)
+
+            if vol_known:
+                vol_bit = int(latest_atr / latest_close > self.volatility_threshold)
+                market_conditions['volatility'] = self._VOL_LEVELS[vol_bit]
             else:
                 market_conditions['volatility'] = 'unknown'
 
-            adx_indicator = ta.trend.ADXIndicator(data['high'], data['low'], data['close'], window=14)
-            data['ADX'] = adx_indicator.adx()
-            latest_adx = data['ADX'].iloc[-1] if not data['ADX'].empty else np.nan
-
-            if not np.isnan(latest_adx):
-                market_conditions['trend'] = 'trending' if latest_adx > self.trend_strength_threshold else 'ranging'
+            if trend_known:
+                trend_bit = int(latest_adx > self.trend_strength_threshold)
+                market_conditions['trend'] = self._TREND_LEVELS[trend_bit]
             else:
                 market_conditions['trend'] = 'unknown'
 
-            if market_conditions.get('trend') == 'trending' and market_conditions.get('volatility') == 'high':
-                market_conditions['regime'] = 'TRENDING_HIGH_VOL'
-            elif market_conditions.get('trend') == 'trending' and market_conditions.get('volatility') == 'low':
-                 market_conditions['regime'] = 'TRENDING_LOW_VOL'
-            elif market_conditions.get('trend') == 'ranging' and market_conditions.get('volatility') == 'high':
-                 market_conditions['regime'] = 'RANGING_HIGH_VOL'
-            elif market_conditions.get('trend') == 'ranging' and market_conditions.get('volatility') == 'low':
-                 market_conditions['regime'] = 'RANGING_LOW_VOL'
+            if vol_known and trend_known:
+                market_conditions['regime'] = self._REGIMES[(trend_bit << 1) | vol_bit]
             else:
-                 market_conditions['regime'] = 'UNCERTAIN'
+                market_conditions['regime'] = 'UNCERTAIN'
 
         except Exception as e:
-            logging.error(f"Error during market condition analysis: {e}")
+            logger.error('Error during market condition analysis: %s', e)
             return {'regime': 'UNKNOWN', 'volatility': 'unknown', 'trend': 'unknown'}
 
-        logging.info(f'Market conditions analyzed: {market_conditions}')
+        if len(self._analysis_cache) >= self._analysis_cache_maxsize:
+            # Evict the oldest entry (dicts preserve insertion order).
+            self._analysis_cache.pop(next(iter(self._analysis_cache)))
+        self._analysis_cache[cache_key] = market_conditions.copy()
+
+        if logger.isEnabledFor(_INFO):
+            logger.info('Market conditions analyzed: %s', market_conditions)
         return market_conditions
 
 
+    def analyze_market_conditions_fast(self, data: pd.DataFrame):
+        """
+        Numeric twin of `analyze_market_conditions` with no dict/string output.
+
+        Classification happens in the compiled classify_regime_code kernel
+        (also exported as a cfunc for non-Python consumers), so the per-bar
+        decision path stays entirely in native code.
+
+        Args:
+            data: A pandas DataFrame containing historical market data (OHLCV).
+
+        Returns:
+            A (RegimeCode, atr_pct, adx) tuple. atr_pct and adx are NaN when
+            the data is unusable, in which case the code is RegimeCode.UNKNOWN.
+        """
+        if data.empty or self._REQUIRED.difference(data.columns):
+            return RegimeCode.UNKNOWN, np.nan, np.nan
+
+        high = np.ascontiguousarray(data['high'].to_numpy(dtype=np.float64))
+        low = np.ascontiguousarray(data['low'].to_numpy(dtype=np.float64))
+        close = np.ascontiguousarray(data['close'].to_numpy(dtype=np.float64))
+
+        latest_atr, latest_adx = atr_adx_last(high, low, close, 14)
+        latest_close = close[-1]
+        code = classify_regime_code(latest_atr, latest_adx, latest_close,
+                                    self.volatility_threshold, self.trend_strength_threshold)
+        atr_pct = latest_atr / latest_close if latest_close != 0 else np.nan
+        return RegimeCode(code), atr_pct, latest_adx
+
+    def suggest_strategy_adjustment_fast(self, regime_code: RegimeCode) -> np.ndarray:
+        """
+        Returns the adjustment row for a regime code from the numeric table.
+
+        Args:
+            regime_code: A RegimeCode (or plain int in its range).
+
+        Returns:
+            A float64 view of (risk_per_trade_multiplier, stop_loss_multiplier,
+            take_profit_multiplier, strategy index into STRATEGY_TYPES).
+        """
+        return self._ADJUSTMENT_CODES[regime_code]
+
+    def reset_streaming_state(self, window: int = 14):
+        """
+        Resets the incremental ATR/ADX state used by `update_bar`.
+
+        Args:
+            window: The Wilder smoothing window for the streaming indicators.
+        """
+        self._stream_window = window
+        self._bar_index = 0
+        self._prev_high = np.nan
+        self._prev_low = np.nan
+        self._prev_close = np.nan
+        self._atr_state = 0.0
+        self._tr_state = 0.0
+        self._plus_dm_state = 0.0
+        self._minus_dm_state = 0.0
+        self._adx_state = 0.0
+        self._dx_count = 0
+
+    def update_bar(self, high: float, low: float, close: float) -> dict:
+        """
+        Applies one streaming Wilder update and classifies the market regime.
+
+        This is the O(1) live-trading path: each tick advances the smoothed
+        TR/+DM/-DM/ADX state in place instead of recomputing the indicators
+        over the full history, and no pandas objects are touched.
+
+        Args:
+            high: The high of the newly closed bar.
+            low: The low of the newly closed bar.
+            close: The close of the newly closed bar.
+
+        Returns:
+            The same market-conditions dictionary as `analyze_market_conditions`
+            ('volatility', 'trend', 'regime'). Until the smoothing windows are
+            warmed up the unknown fields degrade exactly like the bulk path,
+            and a non-finite bar poisons the smoothed state permanently (as a
+            NaN does in the batch kernels) so the regime reports 'UNCERTAIN'
+            until reset_streaming_state / seed_streaming_state.
+        """
+        n = self._stream_window
+        i = self._bar_index
+        self._bar_index = i + 1
+
+        # Mirror the batch kernels' NaN strictness: max() and the comparison
+        # guards below would quietly turn a NaN bar into zeros, so poison the
+        # smoothed state directly instead.
+        if not (math.isfinite(high) and math.isfinite(low) and math.isfinite(close)):
+            self._atr_state = np.nan
+            self._adx_state = np.nan
+
+        if i > 0:
+            tr = max(high - low, abs(high - self._prev_close), abs(low - self._prev_close))
+            up_move = high - self._prev_high
+            down_move = self._prev_low - low
+            plus_dm = up_move if (up_move > down_move and up_move > 0.0) else 0.0
+            minus_dm = down_move if (down_move > up_move and down_move > 0.0) else 0.0
+
+            if i <= n:
+                self._atr_state += tr
+                if i == n:
+                    self._atr_state /= n
+                self._tr_state += tr
+                self._plus_dm_state += plus_dm
+                self._minus_dm_state += minus_dm
+            else:
+                self._atr_state = (self._atr_state * (n - 1) + tr) / n
+                self._tr_state = self._tr_state - self._tr_state / n + tr
+                self._plus_dm_state = self._plus_dm_state - self._plus_dm_state / n + plus_dm
+                self._minus_dm_state = self._minus_dm_state - self._minus_dm_state / n + minus_dm
+
+            if i >= n:
+                if self._tr_state > 0.0:
+                    plus_di = 100.0 * self._plus_dm_state / self._tr_state
+                    minus_di = 100.0 * self._minus_dm_state / self._tr_state
+                    di_sum = plus_di + minus_di
+                    dx = 100.0 * abs(plus_di - minus_di) / di_sum if di_sum > 0.0 else 0.0
+                else:
+                    dx = 0.0
+
+                self._dx_count += 1
+                if self._dx_count <= n:
+                    self._adx_state += dx
+                    if self._dx_count == n:
+                        self._adx_state /= n
+                else:
+                    self._adx_state = (self._adx_state * (n - 1) + dx) / n
+
+        self._prev_high = high
+        self._prev_low = low
+        self._prev_close = close
+
+        market_conditions = {}
+        vol_known = i >= n and close != 0 and math.isfinite(self._atr_state)
+        trend_known = self._dx_count >= n and math.isfinite(self._adx_state)
+
+        if vol_known:
+            vol_bit = int(self._atr_state / close > self.volatility_threshold)
+            market_conditions['volatility'] = self._VOL_LEVELS[vol_bit]
+        else:
+            market_conditions['volatility'] = 'unknown'
+
+        if trend_known:
+            trend_bit = int(self._adx_state > self.trend_strength_threshold)
+            market_conditions['trend'] = self._TREND_LEVELS[trend_bit]
+        else:
+            market_conditions['trend'] = 'unknown'
+
+        if vol_known and trend_known:
+            market_conditions['regime'] = self._REGIMES[(trend_bit << 1) | vol_bit]
+        else:
+            market_conditions['regime'] = 'UNCERTAIN'
+
+        return market_conditions
+
+    def seed_streaming_state(self, data: pd.DataFrame, window: int = 14) -> dict:
+        """
+        Bulk-seeds the streaming state from historical data.
+
+        Replays each historical bar through `update_bar` so that live ticks can
+        continue from a fully warmed-up state.
+
+        Args:
+            data: A pandas DataFrame with 'high', 'low' and 'close' columns.
+            window: The Wilder smoothing window for the streaming indicators.
+
+        Returns:
+            The market-conditions dictionary after the final historical bar,
+            or {'regime': 'UNKNOWN'} if the data is unusable.
+        """
+        self.reset_streaming_state(window)
+        if data.empty:
+            logger.warning('Input data is empty. Cannot seed streaming state.')
+            return {'regime': 'UNKNOWN'}
+
+        missing = self._REQUIRED.difference(data.columns)
+        if missing:
+            logger.error('Missing required data columns for seeding: %s', sorted(missing))
+            return {'regime': 'UNKNOWN'}
+
+        high = data['high'].to_numpy(dtype=np.float64)
+        low = data['low'].to_numpy(dtype=np.float64)
+        close = data['close'].to_numpy(dtype=np.float64)
+
+        market_conditions = {'regime': 'UNKNOWN'}
+        for i in range(high.shape[0]):
+            market_conditions = self.update_bar(high[i], low[i], close[i])
+        return market_conditions
+
+
+    def analyze_market_conditions_sweep(self, data: pd.DataFrame, windows: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the volatility/trend indicators for a batch of window lengths.
+
+        Useful for tuning the analysis thresholds: all windows are computed in
+        one parallel pass over the price arrays rather than one full
+        recomputation per candidate parameter.
+
+        Args:
+            data: A pandas DataFrame containing historical market data (OHLCV).
+            windows: A 1-D array of Wilder window lengths to evaluate.
+
+        Returns:
+            A (len(windows), 2) float64 array where column 0 is the latest ATR
+            as a percentage of the last close and column 1 is the latest ADX.
+            Returns an empty (0, 2) array if the data is unusable.
+        """
+        if data.empty:
+            logger.warning('Input data is empty. Cannot run parameter sweep.')
+            return np.empty((0, 2), dtype=np.float64)
+
+        missing = self._REQUIRED.difference(data.columns)
+        if missing:
+            logger.error('Missing required data columns for sweep: %s', sorted(missing))
+            return np.empty((0, 2), dtype=np.float64)
+
+        high = np.ascontiguousarray(data['high'].to_numpy(dtype=np.float64))
+        low = np.ascontiguousarray(data['low'].to_numpy(dtype=np.float64))
+        close = np.ascontiguousarray(data['close'].to_numpy(dtype=np.float64))
+        windows = np.ascontiguousarray(windows, dtype=np.int64)
+
+        results = atr_adx_sweep(high, low, close, windows)
+        latest_close = close[-1]
+        if latest_close != 0:
+            results[:, 0] /= latest_close
+        return results
+
+
     def suggest_strategy_adjustment(self, market_conditions: dict) -> dict:
         """
         Suggests adjustments to strategy parameters and risk management settings
@@ -115,41 +461,14 @@ class AdaptabilityManager:
             Returns an empty dictionary or default adjustments if conditions are unknown
             or no specific adjustments are defined for the regime.
         """
-        logging.info(f'Suggesting strategy adjustments based on conditions: {market_conditions}')
-        suggested_adjustments = {}
         current_regime = market_conditions.get('regime', 'UNKNOWN')
         volatility_level = market_conditions.get('volatility', 'unknown')
 
-        if current_regime == 'TRENDING_HIGH_VOL':
-            suggested_adjustments['strategy_type'] = 'trend_following'
-            suggested_adjustments['risk_per_trade_multiplier'] = 0.8
-            suggested_adjustments['stop_loss_multiplier'] = 1.5
-            suggested_adjustments['take_profit_multiplier'] = 2.0
-        elif current_regime == 'TRENDING_LOW_VOL':
-            suggested_adjustments['strategy_type'] = 'trend_following'
-            suggested_adjustments['risk_per_trade_multiplier'] = 1.0
-            suggested_adjustments['stop_loss_multiplier'] = 1.0
-            suggested_adjustments['take_profit_multiplier'] = 1.5
-        elif current_regime == 'RANGING_HIGH_VOL':
-            suggested_adjustments['strategy_type'] = 'range_bound'
-            suggested_adjustments['risk_per_trade_multiplier'] = 0.6
-            suggested_adjustments['stop_loss_multiplier'] = 1.8
-            suggested_adjustments['take_profit_multiplier'] = 1.2
-        elif current_regime == 'RANGING_LOW_VOL':
-            suggested_adjustments['strategy_type'] = 'range_bound'
-            suggested_adjustments['risk_per_trade_multiplier'] = 1.0
-            suggested_adjustments['stop_loss_multiplier'] = 1.0
-            suggested_adjustments['take_profit_multiplier'] = 1.0
-        else: # UNKNOWN or UNCERTAIN regime
-            suggested_adjustments['strategy_type'] = 'hold'
-            suggested_adjustments['risk_per_trade_multiplier'] = 0.5
-            suggested_adjustments['stop_loss_multiplier'] = 1.0
-            suggested_adjustments['take_profit_multiplier'] = 1.0
-
-        if volatility_level == 'high' and 'stop_loss_multiplier' in suggested_adjustments:
-             suggested_adjustments['stop_loss_multiplier'] *= 1.2
-        elif volatility_level == 'low' and 'stop_loss_multiplier' in suggested_adjustments:
-             suggested_adjustments['stop_loss_multiplier'] *= 0.8
-
-        logging.info(f'Suggested strategy adjustments: {suggested_adjustments}')
+        suggested_adjustments = self._ADJUSTMENT_TABLE.get(
+            (current_regime, volatility_level),
+            self._ADJUSTMENT_TABLE[(None, 'unknown')]
+        ).copy()
+
+        if logger.isEnabledFor(_INFO):
+            logger.info('Suggested strategy adjustments for %s: %s', (current_regime, volatility_level), suggested_adjustments)
         return suggested_adjustments
@@ -1,6 +1,7 @@
 import logging
 import pandas as pd
 from autonomous_trading_agent.data_fetching.alpaca_data_fetcher import AlpacaDataFetcher
+from autonomous_trading_agent.broker_integration.history_cache import cached_historical_fetch
 from autonomous_trading_agent.execution.alpaca_executor import AlpacaExecutor
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -8,6 +9,11 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 class AlpacaIntegration:
     """
     Integrates data fetching and execution for Alpaca.
+
+    The delegate methods defined on the class are "not initialized" fallbacks;
+    when the fetcher and executor come up successfully, `_bind_delegates`
+    rebinds the public methods straight to the underlying bound methods so
+    each call is one attribute lookup with no per-call None check.
     """
     def __init__(self, api_key: str, api_secret: str, base_url: str = 'https://paper-api.alpaca.markets'):
         """
@@ -22,54 +28,54 @@ class AlpacaIntegration:
             logging.error(f'Error initializing AlpacaIntegration: {e}')
             self.data_fetcher = None
             self.executor = None
+        self._bind_delegates()
 
+    def _bind_delegates(self):
+        """
+        Rebinds the public delegate methods to the live fetcher/executor.
+        """
+        if self.data_fetcher is not None:
+            self._fetch_historical_data_impl = self.data_fetcher.fetch_historical_data
+            self.fetch_realtime_data = self.data_fetcher.fetch_realtime_data
+        if self.executor is not None:
+            self.place_order = self.executor.place_order
+            self.modify_order = self.executor.modify_order
+            self.cancel_order = self.executor.cancel_order
+            self.get_account_balance = self.executor.get_account_balance
+            self.get_open_positions = self.executor.get_open_positions
+            self.get_current_price = self.executor.get_current_price
 
+    @cached_historical_fetch('alpaca')
     def fetch_historical_data(self, symbol: str, timeframe: str, start_date: str, end_date: str) -> pd.DataFrame:
-        if self.data_fetcher:
-            return self.data_fetcher.fetch_historical_data(symbol, timeframe, start_date, end_date)
+        return self._fetch_historical_data_impl(symbol, timeframe, start_date, end_date)
+
+    def _fetch_historical_data_impl(self, symbol: str, timeframe: str, start_date: str, end_date: str) -> pd.DataFrame:
         logging.warning('Data fetcher not initialized.')
         return pd.DataFrame()
 
-
     def fetch_realtime_data(self, symbol: str):
-        if self.data_fetcher:
-            self.data_fetcher.fetch_realtime_data(symbol)
-        else:
-            logging.warning('Data fetcher not initialized.')
-
+        logging.warning('Data fetcher not initialized.')
 
     def place_order(self, symbol: str, order_type: str, quantity: float, price: float = None, stop_loss: float = None, take_profit: float = None):
-        if self.executor:
-            return self.executor.place_order(symbol, order_type, quantity, price, stop_loss, take_profit)
         logging.warning('Executor not initialized.')
         return None
 
     def modify_order(self, order_id: str, new_quantity: float = None, new_price: float = None, new_stop_loss: float = None, new_take_profit: float = None):
-        if self.executor:
-            return self.executor.modify_order(order_id, new_quantity, new_price, new_stop_loss, new_take_profit)
         logging.warning('Executor not initialized.')
         return False
 
     def cancel_order(self, order_id: str):
-        if self.executor:
-            return self.executor.cancel_order(order_id)
         logging.warning('Executor not initialized.')
         return False
 
     def get_account_balance(self) -> float:
-        if self.executor:
-            return self.executor.get_account_balance()
         logging.warning('Executor not initialized.')
         return 0.0
 
-    def get_open_positions(self) -> pd.DataFrame:
-        if self.executor:
-            return self.executor.get_open_positions()
+    def get_open_positions(self) -> list:
         logging.warning('Executor not initialized.')
-        return pd.DataFrame()
+        return []
 
     def get_current_price(self, symbol: str) -> float:
-        if self.executor:
-            return self.executor.get_current_price(symbol)
         logging.warning('Executor not initialized.')
         return 0.0
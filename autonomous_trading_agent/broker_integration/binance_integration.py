@@ -126,17 +126,17 @@ class BinanceIntegration:
         logging.warning('Executor not initialized.')
         return 0.0
 
-    def get_open_positions(self) -> pd.DataFrame:
+    def get_open_positions(self) -> list:
         """
         Delegates the open positions request to the executor.
 
         Returns:
-            A pandas DataFrame with open positions, or an empty DataFrame.
+            A list of Position dataclasses, or an empty list.
         """
         if self.executor:
             return self.executor.get_open_positions()
         logging.warning('Executor not initialized.')
-        return pd.DataFrame()
+        return []
 
     def get_current_price(self, symbol: str) -> float:
         """
@@ -0,0 +1,70 @@
+import functools
+import hashlib
+import logging
+import os
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# On-disk cache for historical bar requests. Over closed historical ranges
+# these fetches are pure functions of their arguments, so repeat backtest
+# runs can be served from local Parquet files instead of the broker API.
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'ata')
+
+# Ranges ending within this window of now are still moving (the live loop
+# requests up to the current minute every iteration) and are never cached —
+# caching them would write a fresh multi-day Parquet file per symbol per
+# minute with nothing ever evicting it.
+CACHE_MIN_AGE = pd.Timedelta(days=1)
+
+
+def _is_closed_range(end_date) -> bool:
+    try:
+        end = pd.Timestamp(end_date)
+    except (ValueError, TypeError):
+        return False
+    return end < pd.Timestamp.now(tz=end.tz) - CACHE_MIN_AGE
+
+
+def _cache_path(broker: str, symbol: str, timeframe: str, start_date, end_date) -> str:
+    key = hashlib.blake2b(
+        f'{broker}|{symbol}|{timeframe}|{start_date}|{end_date}'.encode()).hexdigest()
+    return os.path.join(CACHE_DIR, f'{key}.parquet')
+
+
+def cached_historical_fetch(broker: str):
+    """
+    Decorator caching a fetch_historical_data method on disk.
+
+    The cache key is a blake2b hash of (broker, symbol, timeframe, start,
+    end), so any change to the request produces a different file. Only
+    closed ranges — those ending more than CACHE_MIN_AGE before now — are
+    cached at all; live requests pass straight through. Empty results are
+    never cached, and any cache I/O error falls back to the wrapped fetch.
+
+    Args:
+        broker: A short broker name mixed into the cache key (e.g. 'alpaca').
+    """
+    def decorator(fetch):
+        @functools.wraps(fetch)
+        def wrapper(self, symbol: str, timeframe: str, start_date: str, end_date: str) -> pd.DataFrame:
+            if not _is_closed_range(end_date):
+                return fetch(self, symbol, timeframe, start_date, end_date)
+
+            path = _cache_path(broker, symbol, timeframe, start_date, end_date)
+            if os.path.exists(path):
+                try:
+                    return pd.read_parquet(path)
+                except Exception as e:
+                    logger.warning('Failed to read cached bars %s: %s', path, e)
+
+            data = fetch(self, symbol, timeframe, start_date, end_date)
+            if not data.empty:
+                try:
+                    os.makedirs(CACHE_DIR, exist_ok=True)
+                    data.to_parquet(path)
+                except Exception as e:
+                    logger.warning('Failed to write bar cache %s: %s', path, e)
+            return data
+        return wrapper
+    return decorator
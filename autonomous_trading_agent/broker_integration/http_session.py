@@ -0,0 +1,33 @@
+import logging
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+
+def tune_rest_session(api, pool_connections: int = 32, pool_maxsize: int = 64):
+    """
+    Mounts a pooled keep-alive adapter on an alpaca_trade_api REST session.
+
+    The SDK's default requests adapter keeps a small connection pool, so
+    multi-symbol sweeps pay a fresh TCP/TLS handshake on most calls. A larger
+    pool with keep-alive reuses the negotiated connections, and the retry
+    policy absorbs transient broker hiccups.
+
+    Args:
+        api: An alpaca_trade_api REST instance.
+        pool_connections: Number of host pools to keep.
+        pool_maxsize: Maximum connections per pool.
+    """
+    session = getattr(api, '_session', None)
+    if session is None:
+        logger.warning('REST instance exposes no session to tune; skipping.')
+        return
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=3, backoff_factor=0.2),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['Connection'] = 'keep-alive'
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from abc import ABC, abstractmethod
 
@@ -24,6 +25,38 @@ class BaseDataFetcher(ABC):
         """
         pass
 
+    def fetch_historical_array(self, symbol: str, timeframe: str, start_date: str, end_date: str):
+        """
+        Fetches historical data as raw NumPy arrays instead of a DataFrame.
+
+        This is the fast path for numeric consumers (indicator kernels,
+        vectorized strategies): the OHLCV values arrive as one C-contiguous
+        float64 array in the layout Numba kernels expect, with timestamps in a
+        separate int64 nanosecond array. The default implementation converts
+        the DataFrame from `fetch_historical_data`; brokers can override it to
+        skip the DataFrame round-trip entirely.
+
+        Args:
+            symbol: The trading symbol (e.g., 'AAPL', 'BTCUSD').
+            timeframe: The data timeframe (e.g., '1D', '1H', '15Min', '1Min').
+            start_date: The start date for the historical data.
+            end_date: The end date for the historical data.
+
+        Returns:
+            A (ohlcv, timestamps) tuple where ohlcv is a C-contiguous (N, 5)
+            float64 array of open/high/low/close/volume columns and timestamps
+            is an int64 array of epoch nanoseconds. Both are empty when no
+            data is available.
+        """
+        data = self.fetch_historical_data(symbol, timeframe, start_date, end_date)
+        if data.empty:
+            return np.empty((0, 5), dtype=np.float64), np.empty(0, dtype=np.int64)
+
+        ohlcv = np.ascontiguousarray(
+            data[['open', 'high', 'low', 'close', 'volume']].to_numpy(dtype=np.float64))
+        timestamps = data.index.to_numpy(dtype='datetime64[ns]').view(np.int64)
+        return ohlcv, timestamps
+
     @abstractmethod
     def fetch_realtime_data(self, symbol: str):
         """
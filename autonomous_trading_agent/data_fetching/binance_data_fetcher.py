@@ -1,28 +1,118 @@
+import asyncio
+import numpy as np
 import pandas as pd
 from .base_data_fetcher import BaseDataFetcher
 import logging
 
+# ccxt is optional; the fetcher degrades to empty results with an error log
+# when it is not installed.
+try:
+    import ccxt.async_support as ccxt_async
+except ImportError:
+    ccxt_async = None
+
+# Timeframe string -> ccxt timeframe value.
+_TF_MAP = {'1D': '1d', '1H': '1h', '15Min': '15m', '1Min': '1m'}
+
+# ccxt caps fetch_ohlcv responses, so history is paged in fixed chunks.
+_CHUNK_LIMIT = 1000
+
+
 class BinanceDataFetcher(BaseDataFetcher):
     """
-    Placeholder data fetcher for Binance.
+    Data fetcher for Binance built on ccxt's async OHLCV endpoint.
 
-    This class needs to be fully implemented to fetch data from the Binance API.
+    History is paged off the async client in 1000-bar chunks and lands
+    directly in NumPy arrays; the DataFrame interface is a thin view over
+    the array path.
     """
     def fetch_historical_data(self, symbol: str, timeframe: str, start_date: str, end_date: str) -> pd.DataFrame:
         """
-        Placeholder method for fetching historical data from this broker.
+        Fetches historical OHLCV data from Binance.
 
         Args:
-            symbol: The trading symbol.
-            timeframe: The data timeframe.
-            start_date: The start date.
-            end_date: The end date.
+            symbol: The trading symbol (e.g., 'BTC/USDT').
+            timeframe: The data timeframe ('1D', '1H', '15Min', '1Min').
+            start_date: The start date (ISO 8601 format string).
+            end_date: The end date (ISO 8601 format string).
+
+        Returns:
+            A pandas DataFrame of OHLCV bars indexed by timestamp, or an
+            empty DataFrame on error or no data.
+        """
+        ohlcv, timestamps = self.fetch_historical_array(symbol, timeframe, start_date, end_date)
+        if ohlcv.shape[0] == 0:
+            return pd.DataFrame()
+        return pd.DataFrame(
+            ohlcv,
+            columns=['open', 'high', 'low', 'close', 'volume'],
+            index=pd.DatetimeIndex(timestamps.view('datetime64[ns]'), name='timestamp'),
+        )
+
+    def fetch_historical_array(self, symbol: str, timeframe: str, start_date: str, end_date: str):
+        """
+        Fetches historical OHLCV data from Binance as raw NumPy arrays.
+
+        Args:
+            symbol: The trading symbol (e.g., 'BTC/USDT').
+            timeframe: The data timeframe ('1D', '1H', '15Min', '1Min').
+            start_date: The start date (ISO 8601 format string).
+            end_date: The end date (ISO 8601 format string).
 
         Returns:
-            An empty pandas DataFrame as the method is not yet implemented.
+            A (ohlcv, timestamps) tuple: a C-contiguous (N, 5) float64 array
+            of open/high/low/close/volume and an int64 array of epoch
+            nanoseconds. Both are empty on error or no data.
+        """
+        empty = (np.empty((0, 5), dtype=np.float64), np.empty(0, dtype=np.int64))
+        if ccxt_async is None:
+            logging.error('ccxt is not installed; cannot fetch Binance data.')
+            return empty
+
+        tf = _TF_MAP.get(timeframe)
+        if tf is None:
+            logging.error(f'Unsupported timeframe: {timeframe}')
+            return empty
+
+        try:
+            return asyncio.run(self._fetch_ohlcv_async(symbol, tf, start_date, end_date))
+        except Exception as e:
+            logging.error(f'Error fetching historical data for {symbol}: {e}')
+            return empty
+
+    async def _fetch_ohlcv_async(self, symbol: str, tf: str, start_date: str, end_date: str):
+        """
+        Pages fetch_ohlcv in 1000-bar chunks and concatenates into one array.
         """
-        logging.info('Binance historical data fetching not implemented yet.')
-        return pd.DataFrame()
+        since = int(pd.Timestamp(start_date).value // 1_000_000)
+        end_ms = int(pd.Timestamp(end_date).value // 1_000_000)
+
+        exchange = ccxt_async.binance()
+        chunks = []
+        try:
+            while since < end_ms:
+                batch = await exchange.fetch_ohlcv(symbol, tf, since=since, limit=_CHUNK_LIMIT)
+                if not batch:
+                    break
+                chunk = np.asarray(batch, dtype=np.float64)
+                chunks.append(chunk[chunk[:, 0] <= end_ms])
+                last_ms = int(chunk[-1, 0])
+                if last_ms <= since or last_ms >= end_ms:
+                    break
+                since = last_ms + 1
+        finally:
+            await exchange.close()
+
+        if not chunks:
+            logging.info(f'No historical data found for {symbol} in the specified range.')
+            return np.empty((0, 5), dtype=np.float64), np.empty(0, dtype=np.int64)
+
+        raw = np.concatenate(chunks)
+        ohlcv = np.ascontiguousarray(raw[:, 1:6])
+        # Cast the exact float64 milliseconds to int64 first: multiplying in
+        # float would round nanosecond epochs past the 53-bit mantissa.
+        timestamps = raw[:, 0].astype(np.int64) * 1_000_000
+        return ohlcv, timestamps
 
     def fetch_realtime_data(self, symbol: str):
         """
@@ -1,28 +1,134 @@
+import asyncio
+import numpy as np
 import pandas as pd
 from .base_data_fetcher import BaseDataFetcher
 import logging
 
+# ib_insync is optional; the fetcher degrades to empty results with an error
+# log when it is not installed.
+try:
+    from ib_insync import IB, Stock, util as ib_util
+except ImportError:
+    IB = None
+
+# Timeframe string -> IB bar size setting.
+_BAR_SIZE_MAP = {'1D': '1 day', '1H': '1 hour', '15Min': '15 mins', '1Min': '1 min'}
+
+
 class InteractiveBrokersDataFetcher(BaseDataFetcher):
     """
-    Placeholder data fetcher for Interactive Brokers.
+    Data fetcher for Interactive Brokers built on ib_insync.
 
-    This class needs to be fully implemented to fetch data from the Interactive Brokers API.
+    Historical bars are requested through reqHistoricalDataAsync against a
+    running TWS/Gateway instance and converted straight to NumPy arrays.
     """
+    def __init__(self, host: str = '127.0.0.1', port: int = 7497, client_id: int = 1):
+        """
+        Stores the TWS/Gateway connection parameters.
+
+        Args:
+            host: The TWS/Gateway host.
+            port: The TWS/Gateway port (7497 is the paper-trading default).
+            client_id: The API client id for this connection.
+        """
+        self.host = host
+        self.port = port
+        self.client_id = client_id
+
     def fetch_historical_data(self, symbol: str, timeframe: str, start_date: str, end_date: str) -> pd.DataFrame:
         """
-        Placeholder method for fetching historical data from this broker.
+        Fetches historical bar data from Interactive Brokers.
 
         Args:
-            symbol: The trading symbol.
-            timeframe: The data timeframe.
-            start_date: The start date.
-            end_date: The end date.
+            symbol: The trading symbol (e.g., 'AAPL').
+            timeframe: The data timeframe ('1D', '1H', '15Min', '1Min').
+            start_date: The start date (ISO 8601 format string).
+            end_date: The end date (ISO 8601 format string).
+
+        Returns:
+            A pandas DataFrame of OHLCV bars indexed by timestamp, or an
+            empty DataFrame on error or no data.
+        """
+        ohlcv, timestamps = self.fetch_historical_array(symbol, timeframe, start_date, end_date)
+        if ohlcv.shape[0] == 0:
+            return pd.DataFrame()
+        return pd.DataFrame(
+            ohlcv,
+            columns=['open', 'high', 'low', 'close', 'volume'],
+            index=pd.DatetimeIndex(timestamps.view('datetime64[ns]'), name='timestamp'),
+        )
+
+    def fetch_historical_array(self, symbol: str, timeframe: str, start_date: str, end_date: str):
+        """
+        Fetches historical bar data from Interactive Brokers as NumPy arrays.
+
+        Args:
+            symbol: The trading symbol (e.g., 'AAPL').
+            timeframe: The data timeframe ('1D', '1H', '15Min', '1Min').
+            start_date: The start date (ISO 8601 format string).
+            end_date: The end date (ISO 8601 format string).
 
         Returns:
-            An empty pandas DataFrame as the method is not yet implemented.
+            A (ohlcv, timestamps) tuple: a C-contiguous (N, 5) float64 array
+            of open/high/low/close/volume and an int64 array of epoch
+            nanoseconds. Both are empty on error or no data.
+        """
+        empty = (np.empty((0, 5), dtype=np.float64), np.empty(0, dtype=np.int64))
+        if IB is None:
+            logging.error('ib_insync is not installed; cannot fetch Interactive Brokers data.')
+            return empty
+
+        bar_size = _BAR_SIZE_MAP.get(timeframe)
+        if bar_size is None:
+            logging.error(f'Unsupported timeframe: {timeframe}')
+            return empty
+
+        try:
+            return asyncio.run(self._fetch_bars_async(symbol, bar_size, start_date, end_date))
+        except Exception as e:
+            logging.error(f'Error fetching historical data for {symbol}: {e}')
+            return empty
+
+    async def _fetch_bars_async(self, symbol: str, bar_size: str, start_date: str, end_date: str):
+        """
+        Requests bars over one async TWS connection and converts to arrays.
         """
-        logging.info('Interactive Brokers historical data fetching not implemented yet.')
-        return pd.DataFrame()
+        start = pd.Timestamp(start_date)
+        end = pd.Timestamp(end_date)
+        duration_days = max(1, int((end - start).total_seconds() // 86400) + 1)
+
+        ib = IB()
+        await ib.connectAsync(self.host, self.port, clientId=self.client_id)
+        try:
+            contract = Stock(symbol, 'SMART', 'USD')
+            bars = await ib.reqHistoricalDataAsync(
+                contract,
+                endDateTime=end.to_pydatetime(),
+                durationStr=f'{duration_days} D',
+                barSizeSetting=bar_size,
+                whatToShow='TRADES',
+                useRTH=True,
+            )
+        finally:
+            ib.disconnect()
+
+        if not bars:
+            logging.info(f'No historical data found for {symbol} in the specified range.')
+            return np.empty((0, 5), dtype=np.float64), np.empty(0, dtype=np.int64)
+
+        count = len(bars)
+        ohlcv = np.empty((count, 5), dtype=np.float64)
+        stamps = [None] * count
+        for i, bar in enumerate(bars):
+            row = ohlcv[i]
+            row[0] = bar.open
+            row[1] = bar.high
+            row[2] = bar.low
+            row[3] = bar.close
+            row[4] = bar.volume
+            stamps[i] = bar.date
+        timestamps = pd.to_datetime(stamps).to_numpy(dtype='datetime64[ns]').view(np.int64)
+        return ohlcv, timestamps
 
     def fetch_realtime_data(self, symbol: str):
         """
@@ -1,36 +1,520 @@
 from .base_executor import BaseExecutor
-from alpaca_trade_api.rest import REST
+import asyncio
+from dataclasses import dataclass
+import httpx
+import json
+import numpy as np
 import os
+import time
 from dotenv import load_dotenv
 import logging
 import pandas as pd
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
+
+# websockets is optional; without it get_current_price simply stays on the
+# REST path.
+try:
+    import websockets
+except ImportError:
+    websockets = None
+
+# orjson is optional; fall back to the stdlib codec when unavailable.
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
+    _json_loads = json.loads
+
+_JSON_HEADERS = {'Content-Type': 'application/json'}
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Alpaca market-data REST endpoint; latest trades live on a different host
+# from the trading API.
+DATA_BASE_URL = 'https://data.alpaca.markets'
+
+# Alpaca market-data trade stream (IEX feed).
+STREAM_URL = 'wss://stream.data.alpaca.markets/v2/iex'
+
+# Alpaca caps API calls at 200/min; 50 in-flight orders keeps concurrent
+# fan-out comfortably inside the limit.
+_MAX_CONCURRENT_ORDERS = 50
+
+# Indexed by the sign of the quantity: _SIDES[quantity > 0].
+_SIDES = ('sell', 'buy')
+
+
+@dataclass(slots=True)
+class Position:
+    """
+    One open position as reported by the broker.
+    """
+    symbol: str
+    quantity: float
+    side: str
+    avg_entry_price: float
+    market_value: float
+    unrealized_pl: float
+    unrealized_plpc: float
+
+
+class RateLimitedError(Exception):
+    """Raised when the broker responds with HTTP 429."""
+
+
+class BrokerServerError(Exception):
+    """Raised when the broker responds with an HTTP 5xx."""
+
+
+def _check_response(response):
+    """
+    Maps transient broker failures to retryable exceptions.
+
+    429 and 5xx responses raise RateLimitedError / BrokerServerError so the
+    retry policy backs off and tries again; anything else 4xx raises the
+    plain httpx status error and fails immediately.
+    """
+    code = response.status_code
+    if code == 429:
+        raise RateLimitedError(f'Rate limited: {response.text}')
+    if code >= 500:
+        raise BrokerServerError(f'Broker server error {code}: {response.text}')
+    response.raise_for_status()
+    return response
+
+
+# Exponential backoff with jitter on transient failures only: network-level
+# errors, rate limits and 5xx. Bad requests (4xx) are never retried.
+_retry_transient = retry(
+    retry=retry_if_exception_type((httpx.TransportError, RateLimitedError, BrokerServerError)),
+    wait=wait_exponential_jitter(initial=0.05, max=2.0, exp_base=1.5),
+    stop=stop_after_attempt(4),
+    reraise=True,
+)
+
+
 class AlpacaExecutor(BaseExecutor):
     """
     Order executor specifically for the Alpaca trading platform.
 
-    Implements the BaseExecutor interface using the Alpaca REST API.
-    Requires API_KEY, API_SECRET, and optionally
+    Implements the BaseExecutor interface directly against the Alpaca REST
+    endpoints over one persistent httpx.Client, so every order, cancel and
+    account call reuses the same keep-alive connection pool instead of paying
+    a fresh TCP/TLS handshake. Requires API_KEY, API_SECRET, and optionally
     BASE_URL.
     """
-    def __init__(self, api_key: str, api_secret: str, base_url: str = 'https://paper-api.alpaca.markets'):
+    def __init__(self, api_key: str, api_secret: str, base_url: str = 'https://paper-api.alpaca.markets',
+                 batch_window_ms: float = 5.0, max_batch: int = 25,
+                 balance_ttl_s: float = 0.5, price_ttl_s: float = 0.1):
         """
-        Initializes the AlpacaExecutor by taking API credentials and
-        establishing a REST API connection.
+        Initializes the AlpacaExecutor by taking API credentials and creating
+        the persistent HTTP session.
+
+        Args:
+            api_key: The Alpaca API key.
+            api_secret: The Alpaca API secret.
+            base_url: The trading API base URL.
+            batch_window_ms: Longest time an enqueued order waits before the
+                micro-batch dispatcher flushes it.
+            max_batch: Number of queued orders that triggers an early flush.
+            balance_ttl_s: How long a fetched account balance stays fresh.
+            price_ttl_s: How long a fetched trade price stays fresh.
         """
         self.api_key = api_key
         self.api_secret = api_secret
         self.base_url = base_url
         if not self.api_key or not self.api_secret:
             raise ValueError('Alpaca API key and secret must be provided.')
+        self._session = httpx.Client(
+            base_url=self.base_url,
+            headers={
+                'APCA-API-KEY-ID': self.api_key,
+                'APCA-API-SECRET-KEY': self.api_secret,
+            },
+            limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=300),
+            timeout=10.0,
+            http2=True,
+        )
+        # Async counterpart, created lazily on first use so the sync-only
+        # path never pays for it.
+        self._async_session = None
+        self._order_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_ORDERS)
+        # Micro-batch dispatcher state; the queue and task are created
+        # lazily inside the first running event loop that needs them.
+        self.batch_window_ms = batch_window_ms
+        self.max_batch = max_batch
+        self._pending = None
+        self._dispatcher_task = None
+        # Short-TTL read caches: balance is read right back after most
+        # orders, and prices can be polled many times per tick. Entries are
+        # (value, monotonic timestamp) pairs.
+        self.balance_ttl_s = balance_ttl_s
+        self.price_ttl_s = price_ttl_s
+        self._balance_cache = None
+        self._price_cache = {}
+        # Streaming trade cache: the background task keeps _last_trade
+        # current so get_current_price is a dict lookup, not an HTTP GET.
+        self._last_trade = {}
+        self._stream_symbols = set()
+        self._stream_task = None
+        logger.info('AlpacaExecutor initialized successfully.')
+
+    def close(self):
+        """
+        Tears down the persistent connection pool.
+        """
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _get_async_session(self) -> httpx.AsyncClient:
+        """
+        Returns the shared httpx.AsyncClient, creating it on first use.
+        """
+        if self._async_session is None:
+            self._async_session = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers={
+                    'APCA-API-KEY-ID': self.api_key,
+                    'APCA-API-SECRET-KEY': self.api_secret,
+                },
+                limits=httpx.Limits(max_keepalive_connections=64, keepalive_expiry=300),
+                timeout=10.0,
+                http2=True,
+            )
+        return self._async_session
+
+    @_retry_transient
+    def _request(self, method: str, url: str, **kwargs):
+        """
+        Issues one HTTP request with transient-failure retries.
+
+        Retries network errors, 429s and 5xx responses with jittered
+        exponential backoff (up to 4 attempts); other error statuses raise
+        immediately.
+        """
+        return _check_response(self._session.request(method, url, **kwargs))
+
+    @_retry_transient
+    async def _request_async(self, method: str, url: str, **kwargs):
+        """
+        Async counterpart of _request with the same retry policy.
+        """
+        response = await self._get_async_session().request(method, url, **kwargs)
+        return _check_response(response)
+
+    async def aclose(self):
+        """
+        Stops the micro-batch dispatcher and tears down the async connection
+        pool, if either was created.
+        """
+        if self._dispatcher_task is not None:
+            self._dispatcher_task.cancel()
+            try:
+                await self._dispatcher_task
+            except asyncio.CancelledError:
+                pass
+            self._dispatcher_task = None
+            self._pending = None
+        if self._stream_task is not None:
+            self._stream_task.cancel()
+            try:
+                await self._stream_task
+            except asyncio.CancelledError:
+                pass
+            self._stream_task = None
+        if self._async_session is not None:
+            await self._async_session.aclose()
+            self._async_session = None
+
+    def start_price_stream(self, symbols):
+        """
+        Starts the background trade-stream task for the given symbols.
+
+        Must be called from a running event loop. Each trade message updates
+        _last_trade, after which get_current_price for those symbols is an
+        O(1) dict lookup with no HTTP round-trip. Symbols recorded by later
+        REST cold misses are picked up and subscribed automatically.
+
+        Args:
+            symbols: An iterable of trading symbols to subscribe to.
+        """
+        if websockets is None:
+            logger.error('websockets is not installed; price streaming unavailable.')
+            return
+        self._stream_symbols.update(symbols)
+        if self._stream_task is None:
+            self._stream_task = asyncio.create_task(self._stream_trades())
+
+    async def _stream_trades(self):
+        """
+        Maintains the trade-stream subscription and the _last_trade cache.
+
+        Authenticates, subscribes to the current symbol set, and then updates
+        _last_trade on each trade message. The recv wait is bounded so newly
+        recorded symbols are subscribed within a second; the connection is
+        re-established with a short pause on errors.
+        """
+        while True:
+            try:
+                async with websockets.connect(STREAM_URL) as ws:
+                    await ws.send(json.dumps({'action': 'auth', 'key': self.api_key, 'secret': self.api_secret}))
+                    subscribed = set(self._stream_symbols)
+                    await ws.send(json.dumps({'action': 'subscribe', 'trades': sorted(subscribed)}))
+                    while True:
+                        try:
+                            raw = await asyncio.wait_for(ws.recv(), timeout=1.0)
+                        except asyncio.TimeoutError:
+                            raw = None
+                        if raw is not None:
+                            for msg in json.loads(raw):
+                                if msg.get('T') == 't':
+                                    self._last_trade[msg['S']] = float(msg['p'])
+                        missing = self._stream_symbols - subscribed
+                        if missing:
+                            await ws.send(json.dumps({'action': 'subscribe', 'trades': sorted(missing)}))
+                            subscribed |= missing
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error('Trade stream error, reconnecting: %s', e)
+                await asyncio.sleep(1.0)
+
+    async def place_order_batched(self, symbol: str, order_type: str, quantity: float, price: float = None, stop_loss: float = None, take_profit: float = None):
+        """
+        Enqueues an order for the micro-batch dispatcher and awaits its result.
+
+        Orders arriving within batch_window_ms of each other are flushed
+        concurrently in one go (earlier if max_batch accumulate), amortizing
+        per-call overhead while keeping worst-case added latency bounded by
+        the window.
+
+        Args:
+            Same as place_order_async.
+
+        Returns:
+            The Alpaca order ID (a string) if successful, None otherwise.
+        """
+        if self._pending is None:
+            self._pending = asyncio.Queue()
+            self._dispatcher_task = asyncio.create_task(self._dispatch_loop())
+        future = asyncio.get_running_loop().create_future()
+        await self._pending.put((future, {
+            'symbol': symbol,
+            'order_type': order_type,
+            'quantity': quantity,
+            'price': price,
+            'stop_loss': stop_loss,
+            'take_profit': take_profit,
+        }))
+        return await future
+
+    async def _dispatch_loop(self):
+        """
+        Drains the order queue in bounded-wait batches.
+
+        Blocks until one order arrives, then collects more until either
+        max_batch items accumulate or batch_window_ms elapses, and submits
+        the whole batch concurrently.
+        """
+        window_s = self.batch_window_ms / 1000.0
+        while True:
+            first = await self._pending.get()
+            batch = [first]
+            deadline = asyncio.get_running_loop().time() + window_s
+            while len(batch) < self.max_batch:
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._pending.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            results = await asyncio.gather(
+                *[self.place_order_async(**params) for _, params in batch],
+                return_exceptions=True,
+            )
+            for (future, _), result in zip(batch, results):
+                if future.cancelled():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    def _build_order_params(self, symbol: str, order_type: str, quantity: float, price: float = None, stop_loss: float = None, take_profit: float = None):
+        """
+        Validates the order arguments and builds the /v2/orders payload.
+
+        Returns:
+            The order payload dict, or None if the arguments are invalid.
+        """
+        # Basic validation
+        if quantity == 0:
+            logger.warning('Invalid quantity %s for order on %s.', quantity, symbol)
+            return None
+
+        is_buy = quantity > 0
+        side = _SIDES[is_buy]
+        qty = quantity if is_buy else -quantity
+        ot = order_type.lower()
+
+        order_params = {
+            'symbol': symbol,
+            'qty': qty,
+            'type': ot,
+            'side': side,
+            'time_in_force': 'gtc' # Good 'Til Cancelled
+        }
+
+        if ot == 'limit':
+             if price is None:
+                  logger.error('Limit order requires a price.')
+                  return None
+             order_params['limit_price'] = price
+        elif ot == 'market' and price is not None:
+             logger.warning('Price specified for market order, ignoring.')
+
+
+        # Add stop loss and take profit if provided (as OTO or OCO - depends on broker support)
+        # Alpaca supports bracket orders (OTOCO: One Triggers OCO (One Cancels Other))
+        if stop_loss is not None or take_profit is not None:
+             order_params['order_class'] = 'bracket'
+             if take_profit is not None:
+                  order_params['take_profit'] = {'limit_price': take_profit}
+             if stop_loss is not None:
+                  order_params['stop_loss'] = {'stop_price': stop_loss}
+
+        return order_params
+
+    async def place_order_async(self, symbol: str, order_type: str, quantity: float, price: float = None, stop_loss: float = None, take_profit: float = None):
+        """
+        Coroutine variant of place_order for concurrent fan-out.
+
+        A basket of k orders submitted through asyncio.gather costs roughly
+        one round-trip instead of k serial ones; a semaphore bounds in-flight
+        requests to stay inside Alpaca's rate limit.
+
+        Args:
+            symbol: The trading symbol.
+            order_type: The type of order ('market' or 'limit'). Case-insensitive.
+            quantity: The quantity of shares/contracts. Positive for buy, negative for sell.
+            price: Optional. The limit price for 'limit' orders.
+            stop_loss: Optional. The stop loss price.
+            take_profit: Optional. The take profit price.
+
+        Returns:
+            The Alpaca order ID (a string) if successful, None otherwise.
+        """
         try:
-            self.api = REST(self.api_key, self.api_secret, self.base_url)
-            logging.info('AlpacaExecutor initialized successfully.')
+            order_params = self._build_order_params(symbol, order_type, quantity, price, stop_loss, take_profit)
+            if order_params is None:
+                return None
+
+            async with self._order_semaphore:
+                response = await self._request_async('POST', '/v2/orders', content=_json_dumps(order_params), headers=_JSON_HEADERS)
+            order = _json_loads(response.content)
+            self._balance_cache = None
+            logger.info('Placed %s order for %s shares of %s. Order ID: %s', order_type, quantity, symbol, order['id'])
+            return order['id']
         except Exception as e:
-            logging.error(f'Failed to initialize Alpaca REST API: {e}')
-            raise
+            logger.error('Error placing order for %s: %s', symbol, e)
+            return None
+
+    async def place_orders_batch_async(self, orders: list):
+        """
+        Submits a basket of orders concurrently.
+
+        Args:
+            orders: A list of keyword-argument dicts for place_order_async.
+
+        Returns:
+            A list of order IDs (None entries for failed orders), in input order.
+        """
+        return await asyncio.gather(*[self.place_order_async(**o) for o in orders])
+
+    async def size_and_submit_batch(self, risk_manager, symbols, entry_prices, stop_loss_prices, risk_reward_ratio: float, order_type: str = 'limit'):
+        """
+        Sizes a basket with the vectorized risk methods and submits it in one
+        concurrent burst.
+
+        Position sizes and take profits are computed for all candidates in
+        single NumPy passes, then the resulting orders go out together via
+        asyncio.gather — no per-symbol hops between the risk manager and the
+        executor.
+
+        Args:
+            risk_manager: The RiskManager providing the vectorized sizing.
+            symbols: A sequence of trading symbols.
+            entry_prices: 1-D array of planned entry prices.
+            stop_loss_prices: 1-D array of stop loss prices.
+            risk_reward_ratio: The desired risk/reward ratio for take profits.
+            order_type: The order type for every order in the basket.
+
+        Returns:
+            A list aligned with symbols: the order ID per submitted order,
+            None where sizing failed or submission was rejected.
+        """
+        entries = np.asarray(entry_prices, dtype=np.float64)
+        stops = np.asarray(stop_loss_prices, dtype=np.float64)
+        sizes = risk_manager.calculate_position_size_vec(entries, stops)
+        targets = risk_manager.determine_take_profit_vec(entries, stops, risk_reward_ratio)
+
+        # Shorts have the stop above the entry; flip the quantity sign so
+        # place_order_async picks the sell side.
+        quantities = np.where(entries > stops, sizes, -sizes)
+
+        results = [None] * len(symbols)
+        submit_indices = []
+        coroutines = []
+        for i, symbol in enumerate(symbols):
+            if sizes[i] <= 0 or targets[i] != targets[i]:
+                continue
+            submit_indices.append(i)
+            coroutines.append(self.place_order_async(
+                symbol,
+                order_type,
+                float(quantities[i]),
+                price=float(entries[i]),
+                stop_loss=float(stops[i]),
+                take_profit=float(targets[i]),
+            ))
+
+        if coroutines:
+            for i, order_id in zip(submit_indices, await asyncio.gather(*coroutines)):
+                results[i] = order_id
+        return results
+
+    def place_orders_batch(self, orders: list):
+        """
+        Synchronous wrapper around place_orders_batch_async.
+
+        Spins up an event loop for the duration of the batch and closes the
+        async pool afterwards, since the loop it was bound to goes away.
+
+        Args:
+            orders: A list of keyword-argument dicts for place_order_async.
+
+        Returns:
+            A list of order IDs (None entries for failed orders), in input order.
+        """
+        async def _run():
+            try:
+                return await self.place_orders_batch_async(orders)
+            finally:
+                await self.aclose()
+
+        return asyncio.run(_run())
 
     def place_order(self, symbol: str, order_type: str, quantity: float, price: float = None, stop_loss: float = None, take_profit: float = None):
         """
@@ -46,49 +530,20 @@ class AlpacaExecutor(BaseExecutor):
             take_profit: Optional. The take profit price. Can be included in a bracket order.
 
         Returns:
-            The Alpaca order object ID (a string) if successful, None otherwise.
+            The Alpaca order ID (a string) if successful, None otherwise.
         """
         try:
-            # Basic validation
-            if quantity == 0:
-                logging.warning(f'Invalid quantity {quantity} for order on {symbol}.')
+            order_params = self._build_order_params(symbol, order_type, quantity, price, stop_loss, take_profit)
+            if order_params is None:
                 return None
 
-            side = 'buy' if quantity > 0 else 'sell'
-            qty = abs(quantity)
-
-            order_params = {
-                'symbol': symbol,
-                'qty': qty,
-                'type': order_type.lower(),
-                'side': side,
-                'time_in_force': 'gtc' # Good 'Til Cancelled
-            }
-
-            if order_type.lower() == 'limit' and price is not None:
-                 order_params['limit_price'] = price
-            elif order_type.lower() == 'market' and price is not None:
-                 logging.warning('Price specified for market order, ignoring.')
-            elif order_type.lower() == 'limit' and price is None:
-                 logging.error('Limit order requires a price.')
-                 return None
-
-
-            # Add stop loss and take profit if provided (as OTO or OCO - depends on broker support)
-            # Alpaca supports bracket orders (OTOCO: One Triggers OCO (One Cancels Other))
-            if stop_loss is not None or take_profit is not None:
-                 order_params['order_class'] = 'bracket'
-                 if take_profit is not None:
-                      order_params['take_profit'] = {'limit_price': take_profit}
-                 if stop_loss is not None:
-                      order_params['stop_loss'] = {'stop_price': stop_loss}
-
-
-            order = self.api.submit_order(**order_params)
-            logging.info(f'Placed {order_type} order for {quantity} shares of {symbol}. Order ID: {order.id}')
-            return order.id
+            response = self._request('POST', '/v2/orders', content=_json_dumps(order_params), headers=_JSON_HEADERS)
+            order = _json_loads(response.content)
+            self._balance_cache = None
+            logger.info('Placed %s order for %s shares of %s. Order ID: %s', order_type, quantity, symbol, order['id'])
+            return order['id']
         except Exception as e:
-            logging.error(f'Error placing order for {symbol}: {e}')
+            logger.error('Error placing order for %s: %s', symbol, e)
             return None
 
     def modify_order(self, order_id: str, new_quantity: float = None, new_price: float = None, new_stop_loss: float = None, new_take_profit: float = None):
@@ -113,14 +568,14 @@ class AlpacaExecutor(BaseExecutor):
             if new_take_profit is not None: update_params['take_profit'] = {'limit_price': new_take_profit}
 
             if not update_params:
-                logging.warning(f'No valid parameters provided to modify order {order_id}.')
+                logger.warning('No valid parameters provided to modify order %s.', order_id)
                 return False
 
-            self.api.replace_order(order_id, **update_params)
-            logging.info(f'Modified order {order_id} with updates: {update_params}')
+            response = self._request('PATCH', f'/v2/orders/{order_id}', content=_json_dumps(update_params), headers=_JSON_HEADERS)
+            logger.info('Modified order %s with updates: %s', order_id, update_params)
             return True
         except Exception as e:
-            logging.error(f'Error modifying order {order_id}: {e}')
+            logger.error('Error modifying order %s: %s', order_id, e)
             return False
 
     def cancel_order(self, order_id: str):
@@ -134,11 +589,11 @@ class AlpacaExecutor(BaseExecutor):
             True if the cancellation request was successful, False otherwise.
         """
         try:
-            self.api.cancel_order(order_id)
-            logging.info(f'Cancelled order {order_id}.')
+            response = self._request('DELETE', f'/v2/orders/{order_id}')
+            logger.info('Cancelled order %s.', order_id)
             return True
         except Exception as e:
-            logging.error(f'Error cancelling order {order_id}: {e}')
+            logger.error('Error cancelling order %s: %s', order_id, e)
             return False
 
     def get_account_balance(self) -> float:
@@ -148,49 +603,81 @@ class AlpacaExecutor(BaseExecutor):
         Returns:
             The account equity as a float, or 0.0 if fetching fails.
         """
+        cached = self._balance_cache
+        if cached is not None and time.monotonic() - cached[1] < self.balance_ttl_s:
+            return cached[0]
         try:
-            account = self.api.get_account()
-            balance = float(account.equity)
-            logging.info(f'Fetched account balance: {balance:.2f}')
+            response = self._request('GET', '/v2/account')
+            balance = float(_json_loads(response.content)['equity'])
+            self._balance_cache = (balance, time.monotonic())
+            logger.info('Fetched account balance: %.2f', balance)
             return balance
         except Exception as e:
-            logging.error(f'Error fetching account balance: {e}')
+            logger.error('Error fetching account balance: %s', e)
             return 0.0
 
-    def get_open_positions(self) -> pd.DataFrame:
+    def get_open_positions(self) -> list:
         """
-        Retrieves a list of currently open positions from Alpaca.
+        Retrieves the currently open positions from Alpaca.
 
         Returns:
-            A pandas DataFrame with details of open positions (symbol, quantity,
-            side, average entry price, market value, unrealized P/L), or an empty
-            DataFrame if fetching fails or no positions are open.
+            A list of Position dataclasses (symbol, quantity, side, average
+            entry price, market value, unrealized P/L), or an empty list if
+            fetching fails or no positions are open. Callers that need a
+            DataFrame should use get_open_positions_df.
         """
         try:
-            positions = self.api.list_positions()
+            response = self._request('GET', '/v2/positions')
+            positions = _json_loads(response.content)
             if not positions:
-                logging.info('No open positions found.')
-                return pd.DataFrame()
-
-            positions_data = []
-            for pos in positions:
-                positions_data.append({
-                    'symbol': pos.symbol,
-                    'quantity': float(pos.qty),
-                    'side': pos.side,
-                    'avg_entry_price': float(pos.avg_entry_price),
-                    'market_value': float(pos.market_value),
-                    'unrealized_pl': float(pos.unrealized_pl),
-                    'unrealized_plpc': float(pos.unrealized_plpc)
-                })
-
-            df = pd.DataFrame(positions_data)
-            logging.info(f'Fetched {len(positions)} open positions.')
-            return df
+                logger.info('No open positions found.')
+                return []
+
+            result = [
+                Position(
+                    pos['symbol'],
+                    float(pos['qty']),
+                    pos['side'],
+                    float(pos['avg_entry_price']),
+                    float(pos['market_value']),
+                    float(pos['unrealized_pl']),
+                    float(pos['unrealized_plpc']),
+                )
+                for pos in positions
+            ]
+            logger.info('Fetched %d open positions.', len(result))
+            return result
         except Exception as e:
-            logging.error(f'Error fetching open positions: {e}')
+            logger.error('Error fetching open positions: %s', e)
+            return []
+
+    def get_open_positions_df(self) -> pd.DataFrame:
+        """
+        Retrieves the currently open positions as a pandas DataFrame.
+
+        Convenience wrapper over get_open_positions for display and analysis
+        code; the hot polling path should use the dataclass list directly.
+
+        Returns:
+            A pandas DataFrame of open positions, empty if none are open.
+        """
+        positions = self.get_open_positions()
+        if not positions:
             return pd.DataFrame()
 
+        # Column-wise construction: one list per column instead of one dict
+        # per row, with numeric columns converted in bulk.
+        count = len(positions)
+        return pd.DataFrame({
+            'symbol': [pos.symbol for pos in positions],
+            'quantity': np.fromiter((pos.quantity for pos in positions), dtype=np.float64, count=count),
+            'side': [pos.side for pos in positions],
+            'avg_entry_price': np.fromiter((pos.avg_entry_price for pos in positions), dtype=np.float64, count=count),
+            'market_value': np.fromiter((pos.market_value for pos in positions), dtype=np.float64, count=count),
+            'unrealized_pl': np.fromiter((pos.unrealized_pl for pos in positions), dtype=np.float64, count=count),
+            'unrealized_plpc': np.fromiter((pos.unrealized_plpc for pos in positions), dtype=np.float64, count=count),
+        })
+
     def get_current_price(self, symbol: str) -> float:
         """
         Retrieves the current market price for a given symbol from Alpaca.
@@ -201,11 +688,21 @@ class AlpacaExecutor(BaseExecutor):
         Returns:
             The current price as a float, or 0.0 if fetching fails.
         """
+        streamed = self._last_trade.get(symbol)
+        if streamed is not None:
+            return streamed
+        # Cold miss: record the symbol so an active stream picks it up, and
+        # answer from the short-TTL REST path meanwhile.
+        self._stream_symbols.add(symbol)
+        cached = self._price_cache.get(symbol)
+        if cached is not None and time.monotonic() - cached[1] < self.price_ttl_s:
+            return cached[0]
         try:
-            latest_trade = self.api.get_latest_trade(symbol)
-            price = float(latest_trade.p)
-            logging.info(f'Fetched current price for {symbol}: {price:.2f}')
+            response = self._request('GET', f'{DATA_BASE_URL}/v2/stocks/{symbol}/trades/latest')
+            price = float(_json_loads(response.content)['trade']['p'])
+            self._price_cache[symbol] = (price, time.monotonic())
+            logger.info('Fetched current price for %s: %.2f', symbol, price)
             return price
         except Exception as e:
-            logging.error(f'Error fetching current price for {symbol}: {e}')
+            logger.error('Error fetching current price for %s: %s', symbol, e)
             return 0.0
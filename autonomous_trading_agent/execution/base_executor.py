@@ -1,5 +1,4 @@
 from abc import ABC, abstractmethod
-import pandas as pd
 
 class BaseExecutor(ABC):
     """
@@ -67,13 +66,15 @@ class BaseExecutor(ABC):
         pass
 
     @abstractmethod
-    def get_open_positions(self) -> pd.DataFrame:
+    def get_open_positions(self) -> list:
         """
         Retrieves a list of currently open trading positions.
 
         Returns:
-            A pandas DataFrame with details of open positions, or an empty
-            DataFrame if fetching fails or no positions are open.
+            A list of Position dataclasses (symbol, quantity, side, average
+            entry price, market value, unrealized P/L), or an empty list if
+            fetching fails or no positions are open. Executors that can
+            serve a DataFrame view expose it as get_open_positions_df.
         """
         pass
 
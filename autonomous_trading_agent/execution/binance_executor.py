@@ -1,5 +1,4 @@
 from .base_executor import BaseExecutor
-import pandas as pd
 import logging
 
 class BinanceExecutor(BaseExecutor):
@@ -73,12 +72,12 @@ class BinanceExecutor(BaseExecutor):
         logging.info('Placeholder: Getting account balance via Binance.')
         return 0.0
 
-    def get_open_positions(self) -> pd.DataFrame:
+    def get_open_positions(self) -> list:
         """
         Placeholder method for getting open positions from this broker.
 
         Returns:
-            An empty pandas DataFrame as the method is not yet implemented.
+            An empty list as the method is not yet implemented.
         """
         logging.info('Placeholder: Getting open positions via Binance.')
-        return pd.DataFrame()
+        return []
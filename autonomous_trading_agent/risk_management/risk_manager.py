@@ -1,8 +1,42 @@
 import pandas as pd
 import numpy as np
 import logging
+from numba import njit, types
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Pure-math cores, compiled eagerly with explicit signatures so a backtest
+# replaying millions of ticks pays no interpreter overhead per call.
+# Validation and logging stay in the Python methods.
+
+
+@njit(types.f8(types.f8, types.f8, types.f8, types.f8), cache=True)
+def _position_size(risk_dollars, entry, stop, multiplier):
+    return risk_dollars / (abs(entry - stop) * multiplier)
+
+
+@njit(types.f8(types.f8, types.f8), cache=True)
+def _stop_loss_pct(entry, pct):
+    return entry * (1.0 - pct)
+
+
+@njit(types.f8(types.f8, types.f8), cache=True)
+def _stop_loss_vol(entry, volatility):
+    return entry - volatility * 1.5
+
+
+@njit(types.f8(types.f8, types.f8, types.f8), cache=True)
+def _take_profit(entry, stop, risk_reward_ratio):
+    distance = abs(entry - stop) * risk_reward_ratio
+    return entry + distance if entry > stop else entry - distance
+
+
+@njit(types.f8(types.f8, types.f8, types.b1), cache=True)
+def _trailing_stop(current, level, long_position):
+    if long_position:
+        return max(level, current * 0.98)
+    return min(level, current * 1.02)
 
 class RiskManager:
     """
@@ -11,6 +45,20 @@ class RiskManager:
     Includes functionality for position sizing, setting stop losses and take profits,
     trailing stops, and enforcing daily risk limits.
     """
+    # Slots keep instances small and make attribute reads C-level slot
+    # lookups on the per-bar sizing path. daily_loss_incurred stays a
+    # property over _daily_loss_cents.
+    __slots__ = (
+        'account_balance',
+        'initial_balance',
+        'risk_per_trade_percentage',
+        'daily_risk_limit_percentage',
+        '_daily_loss_cents',
+        '_daily_limit_cents',
+        '_risk_per_trade_dollars',
+        '_daily_risk_limit_dollars',
+    )
+
     def __init__(self, account_balance: float, risk_per_trade_percentage: float, daily_risk_limit_percentage: float):
         """
         Initializes the RiskManager with account details and risk parameters.
@@ -39,8 +87,27 @@ class RiskManager:
         self.initial_balance = account_balance # Store initial balance for daily limit calculation
         self.risk_per_trade_percentage = risk_per_trade_percentage
         self.daily_risk_limit_percentage = daily_risk_limit_percentage
-        self.daily_loss_incurred = 0.0
-        logging.info(f'RiskManager initialized with account balance: {account_balance}, risk per trade: {risk_per_trade_percentage*100}%, daily risk limit: {daily_risk_limit_percentage*100}%')
+        # Daily loss is tracked in integer cents: exact accounting with no
+        # float drift over a day of increments, and the limit check is one
+        # int compare.
+        self._daily_loss_cents = 0
+        self._daily_limit_cents = int(round(account_balance * daily_risk_limit_percentage * 100))
+        # Dollar risk figures are fixed between balance changes; precompute
+        # them so the per-trade sizing and limit checks skip the multiply.
+        self._risk_per_trade_dollars = account_balance * risk_per_trade_percentage
+        self._daily_risk_limit_dollars = account_balance * daily_risk_limit_percentage
+        logger.info('RiskManager initialized with account balance: %s, risk per trade: %s%%, daily risk limit: %s%%', account_balance, risk_per_trade_percentage * 100, daily_risk_limit_percentage * 100)
+
+    @property
+    def daily_loss_incurred(self) -> float:
+        """
+        The total daily loss in dollars, backed by the integer-cents counter.
+        """
+        return self._daily_loss_cents / 100.0
+
+    @daily_loss_incurred.setter
+    def daily_loss_incurred(self, value: float):
+        self._daily_loss_cents = int(round(value * 100))
 
     def calculate_position_size(self, entry_price: float, stop_loss_price: float, asset_multiplier: float = 1.0) -> float:
         """
@@ -58,21 +125,99 @@ class RiskManager:
             not possible (e.g., zero price difference, invalid prices).
         """
         if stop_loss_price <= 0 or entry_price <= 0:
-            logging.error('Entry price and stop loss price must be positive for position sizing.')
+            logger.error('Entry price and stop loss price must be positive for position sizing.')
             return 0.0
 
-        risk_per_trade_dollars = self.account_balance * self.risk_per_trade_percentage
+        risk_per_trade_dollars = self._risk_per_trade_dollars
         price_difference = abs(entry_price - stop_loss_price)
 
         if price_difference == 0:
-            logging.warning('Entry price equals stop loss price. Cannot calculate position size.')
+            logger.warning('Entry price equals stop loss price. Cannot calculate position size.')
             return 0.0
 
         # Position size = (Risk per trade) / (Distance to stop loss * Asset Multiplier)
-        position_size = risk_per_trade_dollars / (price_difference * asset_multiplier)
-        logging.info(f'Calculated position size: {position_size:.2f} for entry {entry_price}, stop loss {stop_loss_price}')
+        position_size = _position_size(risk_per_trade_dollars, entry_price, stop_loss_price, asset_multiplier)
+        logger.info('Calculated position size: %.2f for entry %s, stop loss %s', position_size, entry_price, stop_loss_price)
         return position_size
 
+    def calculate_position_size_vec(self, entry_prices: np.ndarray, stop_loss_prices: np.ndarray, asset_multiplier: float = 1.0) -> np.ndarray:
+        """
+        Vectorized calculate_position_size for a screen of candidates.
+
+        Args:
+            entry_prices: 1-D array of planned entry prices.
+            stop_loss_prices: 1-D array of planned stop loss prices.
+            asset_multiplier: A scalar multiplier for the asset's price.
+
+        Returns:
+            A 1-D array of position sizes, 0.0 where sizing is not possible
+            (non-positive prices or zero stop distance).
+        """
+        entry = np.asarray(entry_prices, dtype=np.float64)
+        stop = np.asarray(stop_loss_prices, dtype=np.float64)
+        denom = np.abs(entry - stop) * asset_multiplier
+        valid = (entry > 0) & (stop > 0) & (denom > 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sizes = np.where(valid, self._risk_per_trade_dollars / denom, 0.0)
+        return sizes
+
+    def determine_stop_loss_vec(self, entry_prices: np.ndarray, stop_loss_distance_percentage: float = None, volatilities: np.ndarray = None) -> np.ndarray:
+        """
+        Vectorized determine_stop_loss.
+
+        Validates the arguments once, then applies the percentage or
+        volatility rule to the whole array in one pass.
+
+        Args:
+            entry_prices: 1-D array of entry prices.
+            stop_loss_distance_percentage: Optional. Scalar percentage distance.
+            volatilities: Optional. 1-D array of volatility measures.
+
+        Returns:
+            A 1-D array of stop loss prices, NaN where calculation is not
+            possible.
+        """
+        entry = np.asarray(entry_prices, dtype=np.float64)
+        if stop_loss_distance_percentage is not None:
+            if not (0 < stop_loss_distance_percentage < 1.0):
+                logger.error('stop_loss_distance_percentage must be between 0 and 1.')
+                return np.full(entry.shape, np.nan)
+            return np.where(entry > 0, entry * (1 - stop_loss_distance_percentage), np.nan)
+        elif volatilities is not None:
+            stops = entry - np.asarray(volatilities, dtype=np.float64) * 1.5
+            stops = np.where(stops <= 0, entry * 0.95, stops)
+            return np.where(entry > 0, stops, np.nan)
+        else:
+            logger.warning('Neither stop_loss_distance_percentage nor volatilities provided to determine stop loss.')
+            return np.full(entry.shape, np.nan)
+
+    def determine_take_profit_vec(self, entry_prices: np.ndarray, stop_loss_prices: np.ndarray, risk_reward_ratio: float) -> np.ndarray:
+        """
+        Vectorized determine_take_profit.
+
+        Args:
+            entry_prices: 1-D array of entry prices.
+            stop_loss_prices: 1-D array of stop loss prices.
+            risk_reward_ratio: The desired risk/reward ratio. Must be positive.
+
+        Returns:
+            A 1-D array of take profit prices, NaN where calculation is not
+            possible.
+        """
+        entry = np.asarray(entry_prices, dtype=np.float64)
+        stop = np.asarray(stop_loss_prices, dtype=np.float64)
+        if risk_reward_ratio <= 0:
+            logger.error('risk_reward_ratio must be positive to determine take profit.')
+            return np.full(entry.shape, np.nan)
+
+        distance = np.abs(entry - stop) * risk_reward_ratio
+        # Long above the entry, short below; shorts that would go negative
+        # fall back to the same arbitrary floor as the scalar path.
+        targets = np.where(entry > stop, entry + distance, entry - distance)
+        targets = np.where(targets < 0, entry * 0.05, targets)
+        valid = (entry > 0) & (stop > 0) & (entry != stop)
+        return np.where(valid, targets, np.nan)
+
     def determine_stop_loss(self, entry_price: float, stop_loss_distance_percentage: float = None, volatility: float = None) -> float:
         """
         Determines the stop loss price based on the entry price and either a
@@ -91,27 +236,27 @@ class RiskManager:
             (e.g., invalid inputs, no method specified).
         """
         if entry_price <= 0:
-            logging.error('Entry price must be positive to determine stop loss.')
+            logger.error('Entry price must be positive to determine stop loss.')
             return np.nan
 
         if stop_loss_distance_percentage is not None:
             if not (0 < stop_loss_distance_percentage < 1.0):
-                logging.error('stop_loss_distance_percentage must be between 0 and 1.')
+                logger.error('stop_loss_distance_percentage must be between 0 and 1.')
                 return np.nan
-            stop_loss_price = entry_price * (1 - stop_loss_distance_percentage)
-            logging.info(f'Determined stop loss at: {stop_loss_price:.4f} based on percentage.')
+            stop_loss_price = _stop_loss_pct(entry_price, stop_loss_distance_percentage)
+            logger.info('Determined stop loss at: %.4f based on percentage.', stop_loss_price)
             return stop_loss_price
         elif volatility is not None:
             # Example using volatility (e.g., multiples of ATR or standard deviation)
             # This is a simplified example; real implementation would need current volatility measure
-            stop_loss_price = entry_price - (volatility * 1.5) # Example: 1.5 times volatility below entry
+            stop_loss_price = _stop_loss_vol(entry_price, volatility) # Example: 1.5 times volatility below entry
             if stop_loss_price <= 0:
-                 logging.warning('Calculated stop loss is non-positive, setting to a small value above zero.')
+                 logger.warning('Calculated stop loss is non-positive, setting to a small value above zero.')
                  stop_loss_price = entry_price * 0.95 # Arbitrary small value
-            logging.info(f'Determined stop loss at: {stop_loss_price:.4f} based on volatility.')
+            logger.info('Determined stop loss at: %.4f based on volatility.', stop_loss_price)
             return stop_loss_price
         else:
-            logging.warning('Neither stop_loss_distance_percentage nor volatility provided to determine stop loss.')
+            logger.warning('Neither stop_loss_distance_percentage nor volatility provided to determine stop loss.')
             return np.nan
 
     def determine_take_profit(self, entry_price: float, stop_loss_price: float, risk_reward_ratio: float) -> float:
@@ -129,25 +274,19 @@ class RiskManager:
             (e.g., zero price difference, invalid inputs).
         """
         if entry_price <= 0 or stop_loss_price <= 0 or risk_reward_ratio <= 0:
-            logging.error('Entry price, stop loss price, and risk_reward_ratio must be positive to determine take profit.')
+            logger.error('Entry price, stop loss price, and risk_reward_ratio must be positive to determine take profit.')
             return np.nan
 
-        price_difference = abs(entry_price - stop_loss_price)
-        # Take profit distance = Risk distance * Risk/Reward Ratio
-        take_profit_distance = price_difference * risk_reward_ratio
-
-        if entry_price > stop_loss_price: # Long position
-            take_profit_price = entry_price + take_profit_distance
-        elif entry_price < stop_loss_price: # Short position
-            take_profit_price = entry_price - take_profit_distance
-            if take_profit_price < 0:
-                 logging.warning('Calculated take profit for short is non-positive, setting to a small value above zero.')
-                 take_profit_price = entry_price * 0.05 # Arbitrary small value
-        else:
-            logging.warning('Entry price equals stop loss price. Cannot determine take profit.')
+        if entry_price == stop_loss_price:
+            logger.warning('Entry price equals stop loss price. Cannot determine take profit.')
             return np.nan
 
-        logging.info(f'Determined take profit at: {take_profit_price:.4f} for entry {entry_price}, stop loss {stop_loss_price}, R:R {risk_reward_ratio}')
+        take_profit_price = _take_profit(entry_price, stop_loss_price, risk_reward_ratio)
+        if take_profit_price < 0: # Short position driven below zero
+             logger.warning('Calculated take profit for short is non-positive, setting to a small value above zero.')
+             take_profit_price = entry_price * 0.05 # Arbitrary small value
+
+        logger.info('Determined take profit at: %.4f for entry %s, stop loss %s, R:R %s', take_profit_price, entry_price, stop_loss_price, risk_reward_ratio)
         return take_profit_price
 
     def update_trailing_stop(self, current_price: float, trailing_stop_level: float, long_position: bool) -> float:
@@ -167,23 +306,35 @@ class RiskManager:
             The new trailing stop level. Returns the original level if no update
             is triggered by the current price.
         """
-        # This method would be called periodically with the latest price
-        # The trailing_stop_level is the current stop level that needs potential adjustment
-        if long_position:
-            # For a long position, the stop moves up as price increases
-            new_trailing_stop = max(trailing_stop_level, current_price * 0.98) # Example: Trail by 2% below current price
-            if new_trailing_stop > trailing_stop_level:
-                logging.info(f'Trailing stop for long updated from {trailing_stop_level:.4f} to {new_trailing_stop:.4f}')
-                return new_trailing_stop
-        else: # Short position
-            # For a short position, the stop moves down as price decreases
-            new_trailing_stop = min(trailing_stop_level, current_price * 1.02) # Example: Trail by 2% above current price
-            if new_trailing_stop < trailing_stop_level:
-                 logging.info(f'Trailing stop for short updated from {trailing_stop_level:.4f} to {new_trailing_stop:.4f}')
-                 return new_trailing_stop
-
-        # If no update, return the original trailing stop level
-        return trailing_stop_level
+        # This method is called once per tick per position; the compiled
+        # core does the trail in a handful of scalar ops and a log is only
+        # formatted on actual movement.
+        new_trailing_stop = _trailing_stop(current_price, trailing_stop_level, long_position)
+
+        if new_trailing_stop != trailing_stop_level and logger.isEnabledFor(logging.INFO):
+            logger.info('Trailing stop for %s updated from %.4f to %.4f', 'long' if long_position else 'short', trailing_stop_level, new_trailing_stop)
+        return new_trailing_stop
+
+    def update_trailing_stops_vec(self, prices: np.ndarray, stops: np.ndarray, long_mask: np.ndarray) -> np.ndarray:
+        """
+        Updates trailing stop levels for a whole book of positions at once.
+
+        Branchless NumPy equivalent of update_trailing_stop: long positions
+        ratchet up to 2% below price, shorts ratchet down to 2% above.
+
+        Args:
+            prices: 1-D array of current market prices.
+            stops: 1-D array of current trailing stop levels.
+            long_mask: 1-D boolean array, True where the position is long.
+
+        Returns:
+            A 1-D array of the new trailing stop levels.
+        """
+        return np.where(
+            long_mask,
+            np.maximum(stops, prices * 0.98),
+            np.minimum(stops, prices * 1.02),
+        )
 
 
     def check_daily_risk_limit(self) -> bool:
@@ -193,11 +344,10 @@ class RiskManager:
         Returns:
             True if the daily loss is within the limit, False otherwise.
         """
-        daily_risk_limit_dollars = self.initial_balance * self.daily_risk_limit_percentage
-        if self.daily_loss_incurred >= daily_risk_limit_dollars:
-            logging.warning(f'Daily risk limit reached. Total daily loss: {self.daily_loss_incurred:.2f}, Limit: {daily_risk_limit_dollars:.2f}')
+        if self._daily_loss_cents >= self._daily_limit_cents:
+            logger.warning('Daily risk limit reached. Total daily loss: %.2f, Limit: %.2f', self.daily_loss_incurred, self._daily_limit_cents / 100.0)
             return False # Limit reached, trading should stop
-        logging.info(f'Daily risk limit not reached. Total daily loss: {self.daily_loss_incurred:.2f}, Limit: {daily_risk_limit_dollars:.2f}')
+        logger.info('Daily risk limit not reached. Total daily loss: %.2f, Limit: %.2f', self.daily_loss_incurred, self._daily_limit_cents / 100.0)
         return True # Limit not reached, trading can continue
 
     def update_daily_loss(self, loss_amount: float):
@@ -210,12 +360,13 @@ class RiskManager:
             loss_amount: The amount of loss from the closed trade (should be positive).
         """
         if loss_amount > 0:
-            self.daily_loss_incurred += loss_amount
+            self._daily_loss_cents += int(round(loss_amount * 100))
             self.account_balance -= loss_amount # Update account balance after a loss
-            logging.info(f'Daily loss updated by {loss_amount:.2f}. Total daily loss incurred: {self.daily_loss_incurred:.2f}')
-            logging.info(f'Account balance updated to: {self.account_balance:.2f}')
+            self._risk_per_trade_dollars = self.account_balance * self.risk_per_trade_percentage
+            logger.info('Daily loss updated by %.2f. Total daily loss incurred: %.2f', loss_amount, self.daily_loss_incurred)
+            logger.info('Account balance updated to: %.2f', self.account_balance)
         elif loss_amount < 0:
-            logging.warning('Loss amount should be positive. Use update_daily_profit for gains.')
+            logger.warning('Loss amount should be positive. Use update_daily_profit for gains.')
 
 
     def reset_daily_loss(self):
@@ -224,8 +375,11 @@ class RiskManager:
 
         This method should be called at the beginning of each new trading day.
         """
-        self.daily_loss_incurred = 0.0
+        self._daily_loss_cents = 0
         # Note: Account balance is not reset here, it reflects the current balance
         # You might want to reset initial_balance if account_balance changes significantly day-to-day
         self.initial_balance = self.account_balance # Reset initial balance for next day's limit calculation
-        logging.info('Daily loss reset.')
+        self._daily_limit_cents = int(round(self.initial_balance * self.daily_risk_limit_percentage * 100))
+        self._risk_per_trade_dollars = self.account_balance * self.risk_per_trade_percentage
+        self._daily_risk_limit_dollars = self.initial_balance * self.daily_risk_limit_percentage
+        logger.info('Daily loss reset.')
@@ -0,0 +1,179 @@
+import numpy as np
+import os
+from numba import njit, types
+
+# Readonly array signatures, matching the adaptability kernels: pandas 3.x
+# copy-on-write hands out readonly views from to_numpy(), and readonly
+# parameters accept writable arrays as well.
+_F8_RO = types.Array(types.f8, 1, 'C', readonly=True)
+_SWING_SIG = types.UniTuple(types.Array(types.u1, 1, 'C'), 2)(_F8_RO, _F8_RO, types.i8)
+
+
+@njit(_SWING_SIG, cache=True, nogil=True, boundscheck=False)
+def swing_flags(high, low, w):
+    """
+    Flags swing highs and swing lows over a rolling lookback in one pass.
+
+    Equivalent to (rolling(w).max() == high) and (rolling(w).min() == low)
+    but computed with monotonic index deques (ascending/descending minima),
+    so the cost is O(N) instead of the O(N*W) pairwise comparisons pandas
+    rolling performs on long histories. Bars whose window is incomplete or
+    contains a NaN are flagged 0, matching the NaN the pandas rolling
+    produces there.
+
+    Args:
+        high: 1-D float64 array of high prices.
+        low: 1-D float64 array of low prices.
+        w: The rolling lookback window.
+
+    Returns:
+        A (swing_high, swing_low) tuple of uint8 arrays (1 where the bar is
+        the extreme of its window, else 0).
+    """
+    n = high.shape[0]
+    swing_high = np.zeros(n, dtype=np.uint8)
+    swing_low = np.zeros(n, dtype=np.uint8)
+
+    # Index deques stored in plain arrays with head/tail cursors; values in
+    # the max deque decrease front-to-back, the min deque increases.
+    max_deque = np.empty(n, dtype=np.int64)
+    min_deque = np.empty(n, dtype=np.int64)
+    max_head = 0
+    max_tail = 0
+    min_head = 0
+    min_tail = 0
+
+    # A NaN invalidates every window it falls in, per series.
+    last_nan_high = -w
+    last_nan_low = -w
+
+    for i in range(n):
+        hi = high[i]
+        lo = low[i]
+        if hi != hi:
+            last_nan_high = i
+        if lo != lo:
+            last_nan_low = i
+
+        while max_tail > max_head and high[max_deque[max_tail - 1]] <= hi:
+            max_tail -= 1
+        max_deque[max_tail] = i
+        max_tail += 1
+        while max_deque[max_head] <= i - w:
+            max_head += 1
+
+        while min_tail > min_head and low[min_deque[min_tail - 1]] >= lo:
+            min_tail -= 1
+        min_deque[min_tail] = i
+        min_tail += 1
+        while min_deque[min_head] <= i - w:
+            min_head += 1
+
+        if i >= w - 1:
+            if i - last_nan_high >= w and high[max_deque[max_head]] == hi:
+                swing_high[i] = 1
+            if i - last_nan_low >= w and low[min_deque[min_head]] == lo:
+                swing_low[i] = 1
+
+    return swing_high, swing_low
+
+
+_F4_RO = types.Array(types.f4, 1, 'C', readonly=True)
+_SIGNAL_SIGS = [
+    types.i8(_F8_RO, _F8_RO, _F8_RO, _F8_RO, types.i8, types.i8, types.i8, types.i8),
+    types.i8(_F4_RO, _F4_RO, _F4_RO, _F4_RO, types.i8, types.i8, types.i8, types.i8),
+]
+
+
+@njit(_SIGNAL_SIGS, cache=True, nogil=True, boundscheck=False)
+def signal_code(close, high, low, volume, w_short, w_long, w_swing, w_volume):
+    """
+    Computes the latest-bar combined signal entirely in compiled code.
+
+    Fuses the short/long SMA means, swing-extreme check and volume mean of
+    the per-bar signal path into one call, so Python-level work per bar is
+    a single kernel invocation. Evaluation order mirrors the short-circuit
+    structure of the interpreted path: trend direction first, then the
+    close/swing/volume conditions for the live branch only. NaNs inside
+    any window fail the affected condition, as they did with the
+    slice-based reductions. Signatures cover float64 and float32 input.
+
+    Args:
+        close: 1-D float array of close prices.
+        high: 1-D float array of high prices.
+        low: 1-D float array of low prices.
+        volume: 1-D float array of volumes.
+        w_short: Short SMA window.
+        w_long: Long SMA window.
+        w_swing: Swing-extreme lookback window.
+        w_volume: Volume SMA window.
+
+    Returns:
+        1 for BUY, -1 for SELL, 0 for HOLD.
+    """
+    n = close.shape[0]
+    if n < w_long:
+        return 0
+    c = close[n - 1]
+    if c != c:
+        return 0
+
+    s = 0.0
+    for i in range(n - w_short, n):
+        s += close[i]
+    sma_short = s / w_short
+    s = 0.0
+    for i in range(n - w_long, n):
+        s += close[i]
+    sma_long = s / w_long
+    sma_diff = sma_short - sma_long
+
+    if sma_diff > 0:
+        if not (c > sma_long):
+            return 0
+        last = low[n - 1]
+        if last != last:
+            return 0
+        for i in range(n - w_swing, n - 1):
+            v = low[i]
+            if v != v or v < last:
+                return 0
+        s = 0.0
+        for i in range(n - w_volume, n):
+            s += volume[i]
+        if s / w_volume > 0:
+            return 1
+    elif sma_diff < 0:
+        if not (c < sma_long):
+            return 0
+        last = high[n - 1]
+        if last != last:
+            return 0
+        for i in range(n - w_swing, n - 1):
+            v = high[i]
+            if v != v or v > last:
+                return 0
+        s = 0.0
+        for i in range(n - w_volume, n):
+            s += volume[i]
+        if s / w_volume > 0:
+            return -1
+    return 0
+
+
+def _warmup():
+    """
+    Runs the kernel once on a tiny dummy array.
+
+    With cache=True the machine code persists across processes; this just
+    forces the cached artifact to load ahead of the first live bar. Guarded
+    behind an environment flag so short-lived processes (tests, CLI tools)
+    that never hit the kernel don't pay for it.
+    """
+    dummy = np.arange(4, dtype=np.float64)
+    swing_flags(dummy, dummy, 2)
+    signal_code(dummy, dummy, dummy, dummy, 2, 2, 2, 2)
+
+
+if os.environ.get('TITAN_FORGE_WARMUP'):
+    _warmup()
@@ -1,9 +1,98 @@
 import pandas as pd
 from abc import ABC, abstractmethod
-import ta
+from collections import deque
 import numpy as np
 import logging
 
+from ._kernels import signal_code, swing_flags
+
+logger = logging.getLogger(__name__)
+
+# Maps signal_code's return value to the public signal strings; the -1
+# SELL code indexes from the end.
+_SIGNAL_NAMES = ('HOLD', 'BUY', 'SELL')
+
+
+class _IncrementalSMA:
+    """
+    O(1) rolling mean over the last `window` values.
+
+    Keeps a running sum alongside a bounded deque, so each new bar costs
+    one subtraction and one addition instead of re-summing the window. A
+    NaN inside the window poisons the running sum (the mean goes NaN until
+    the NaN leaves), matching how pandas rolling means behave.
+    """
+    __slots__ = ('_values', '_sum')
+
+    def __init__(self, window: int):
+        self._values = deque(maxlen=window)
+        self._sum = 0.0
+
+    def update(self, value: float) -> float:
+        """
+        Pushes one value and returns the mean of the current window.
+        """
+        values = self._values
+        if len(values) == values.maxlen:
+            evicted = values[0]
+            if evicted != evicted:
+                # Subtracting a NaN back out cannot repair the sum;
+                # rebuild it once the NaN falls out of the window.
+                values.append(value)
+                self._sum = sum(values)
+                return self._sum / len(values)
+            self._sum -= evicted
+        values.append(value)
+        self._sum += value
+        return self._sum / len(values)
+
+    @property
+    def ready(self) -> bool:
+        """Whether a full window has been observed."""
+        return len(self._values) == self._values.maxlen
+
+
+class _IncrementalExtreme:
+    """
+    O(1) amortized rolling max-or-min tracker over the last `window` values.
+
+    Uses a monotonic deque of (index, value) pairs, the streaming analogue
+    of the batch `swing_flags` kernel: each bar is pushed and popped at
+    most once. `update` returns True when the newest value is the extreme
+    of its full, NaN-free window — the same condition the batch kernel
+    flags.
+    """
+    __slots__ = ('window', '_is_max', '_deque', '_count', '_last_nan')
+
+    def __init__(self, window: int, is_max: bool):
+        self.window = window
+        self._is_max = is_max
+        self._deque = deque()
+        self._count = 0
+        self._last_nan = -window
+
+    def update(self, value: float) -> bool:
+        """
+        Pushes one value and returns whether it is the window's extreme.
+        """
+        i = self._count
+        self._count = i + 1
+        if value != value:
+            self._last_nan = i
+        dq = self._deque
+        if self._is_max:
+            while dq and dq[-1][1] <= value:
+                dq.pop()
+        else:
+            while dq and dq[-1][1] >= value:
+                dq.pop()
+        dq.append((i, value))
+        while dq[0][0] <= i - self.window:
+            dq.popleft()
+        if i < self.window - 1 or i - self._last_nan < self.window:
+            return False
+        return dq[0][1] == value
+
 class BaseTradingStrategy(ABC):
     """
     Abstract base class for defining a trading strategy.
@@ -34,10 +123,21 @@ class CombinedStrategy(BaseTradingStrategy):
     This is a placeholder implementation and needs detailed logic based on
     specific interpretations of PVG, SMC, and TPR.
     """
-    def __init__(self):
+    def __init__(self, precision: str = 'fp64'):
         """
         Initializes the CombinedStrategy with parameters for its constituent analyses.
+
+        Args:
+            precision: 'fp64' (default) or 'fp32'. With 'fp32' the signal
+                       path extracts OHLCV as float32, halving the memory
+                       traffic of the tail reductions — useful for long
+                       backtest sweeps where price magnitudes comfortably
+                       fit single precision. Live trading should keep the
+                       default.
         """
+        if precision not in ('fp64', 'fp32'):
+            raise ValueError("precision must be 'fp64' or 'fp32'.")
+        self._dtype = np.float32 if precision == 'fp32' else np.float64
         # Parameters for PVG (example: periods for moving averages)
         self.pvg_short_period = 14
         self.pvg_long_period = 50
@@ -45,7 +145,23 @@ class CombinedStrategy(BaseTradingStrategy):
         self.smc_lookback = 20
         # Parameters for TPR (example: volume moving average period)
         self.tpr_volume_period = 20
-        pass
+        # Window tuple bound once; the hot path unpacks it into locals
+        # instead of chasing four instance attributes per bar.
+        self._windows = (self.pvg_short_period, self.pvg_long_period, self.smc_lookback, self.tpr_volume_period)
+        self.reset_incremental_state()
+
+    def reset_incremental_state(self):
+        """
+        (Re)creates the per-bar streaming state used by
+        `generate_signal_incremental`. Call this when switching symbols or
+        after a data gap so stale window contents don't leak into the new
+        stream.
+        """
+        self._sma_short = _IncrementalSMA(self.pvg_short_period)
+        self._sma_long = _IncrementalSMA(self.pvg_long_period)
+        self._volume_sma = _IncrementalSMA(self.tpr_volume_period)
+        self._high_extreme = _IncrementalExtreme(self.smc_lookback, is_max=True)
+        self._low_extreme = _IncrementalExtreme(self.smc_lookback, is_max=False)
 
     def _analyze_pvg(self, data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -60,12 +176,12 @@ class CombinedStrategy(BaseTradingStrategy):
         Returns:
             The DataFrame with added PVG-related indicators/features.
         """
-        logging.info('Performing PVG analysis...')
+        logger.debug('Performing PVG analysis...')
         if 'close' in data.columns:
-            data['PVG_SMA_Short'] = ta.trend.sma_indicator(data['close'], window=self.pvg_short_period)
-            data['PVG_SMA_Long'] = ta.trend.sma_indicator(data['close'], window=self.pvg_long_period)
+            data['PVG_SMA_Short'] = data['close'].rolling(window=self.pvg_short_period, min_periods=self.pvg_short_period).mean()
+            data['PVG_SMA_Long'] = data['close'].rolling(window=self.pvg_long_period, min_periods=self.pvg_long_period).mean()
         else:
-             logging.warning('Close price column not found for PVG analysis.')
+             logger.warning('Close price column not found for PVG analysis.')
         return data
 
     def _analyze_smc(self, data: pd.DataFrame) -> pd.DataFrame:
@@ -81,12 +197,17 @@ class CombinedStrategy(BaseTradingStrategy):
         Returns:
             The DataFrame with added SMC-related indicators/features.
         """
-        logging.info('Performing SMC analysis...')
+        logger.debug('Performing SMC analysis...')
         if 'high' in data.columns and 'low' in data.columns:
-            data['SMC_Swing_High'] = (data['high'].rolling(window=self.smc_lookback).max() == data['high']).astype(int)
-            data['SMC_Swing_Low'] = (data['low'].rolling(window=self.smc_lookback).min() == data['low']).astype(int)
+            swing_high, swing_low = swing_flags(
+                data['high'].to_numpy(dtype=np.float64),
+                data['low'].to_numpy(dtype=np.float64),
+                self.smc_lookback,
+            )
+            data['SMC_Swing_High'] = swing_high.astype(np.int64)
+            data['SMC_Swing_Low'] = swing_low.astype(np.int64)
         else:
-            logging.warning('High or Low price columns not found for SMC analysis.')
+            logger.warning('High or Low price columns not found for SMC analysis.')
         return data
 
     def _analyze_tpr(self, data: pd.DataFrame) -> pd.DataFrame:
@@ -102,52 +223,153 @@ class CombinedStrategy(BaseTradingStrategy):
         Returns:
             The DataFrame with added TPR-related indicators/features.
         """
-        logging.info('Performing TPR analysis...')
+        logger.debug('Performing TPR analysis...')
         if 'volume' in data.columns:
-            data['TPR_Volume_SMA'] = ta.trend.sma_indicator(data['volume'], window=self.tpr_volume_period)
+            data['TPR_Volume_SMA'] = data['volume'].rolling(window=self.tpr_volume_period, min_periods=self.tpr_volume_period).mean()
         else:
              data['TPR_Volume_SMA'] = np.nan # Handle case where volume is missing
-             logging.warning('Volume column not found for TPR analysis.')
+             logger.warning('Volume column not found for TPR analysis.')
         return data
 
 
-    def generate_signal(self, data: pd.DataFrame) -> str:
+    def compute_features(self, data: pd.DataFrame) -> pd.DataFrame:
         """
-        Generates a trading signal (BUY, SELL, or HOLD) based on the combined analysis.
+        Assembles the full-history indicator columns into a new DataFrame.
+
+        Unlike the `_analyze_*` helpers, which write columns into whatever
+        frame they are handed, this builds only the needed columns from
+        Series views with `copy=False`, so the caller's frame is never
+        copied or mutated. Intended for backtests and feature export where
+        the whole indicator history is wanted rather than the latest signal.
+
+        Args:
+            data: A pandas DataFrame with 'close', 'high', 'low' and
+                  'volume' columns.
+
+        Returns:
+            A new DataFrame with 'close' and the PVG/SMC/TPR indicator
+            columns, sharing the input's index and close values.
         """
-        if data.empty:
-            logging.warning('Input data is empty. Cannot generate signal.')
-            return 'HOLD'
+        close = data['close']
+        swing_high, swing_low = swing_flags(
+            data['high'].to_numpy(dtype=np.float64),
+            data['low'].to_numpy(dtype=np.float64),
+            self.smc_lookback,
+        )
+        return pd.DataFrame(
+            {
+                'close': close,
+                'PVG_SMA_Short': close.rolling(window=self.pvg_short_period, min_periods=self.pvg_short_period).mean(),
+                'PVG_SMA_Long': close.rolling(window=self.pvg_long_period, min_periods=self.pvg_long_period).mean(),
+                'SMC_Swing_High': swing_high.astype(np.int64),
+                'SMC_Swing_Low': swing_low.astype(np.int64),
+                'TPR_Volume_SMA': data['volume'].rolling(window=self.tpr_volume_period, min_periods=self.tpr_volume_period).mean(),
+            },
+            index=data.index,
+            copy=False,
+        )
 
-        processed_data = self._analyze_pvg(data.copy())
-        processed_data = self._analyze_smc(processed_data)
-        processed_data = self._analyze_tpr(processed_data)
+    def _signal_from_arrays(self, close: np.ndarray, high: np.ndarray, low: np.ndarray, volume: np.ndarray) -> str:
+        """
+        Computes the combined signal from raw price/volume arrays.
 
-        processed_data.dropna(inplace=True)
+        Only the latest bar's decision is needed, so the whole evaluation —
+        warm-up guard, SMA means, swing extreme and volume check — runs in
+        the fused `signal_code` kernel; Python's share of the work is one
+        call and a tuple index. NaNs inside any window fail the affected
+        condition, yielding HOLD, which matches the old dropna behaviour
+        for the latest bar.
+        """
+        w_short, w_long, w_swing, w_volume = self._windows
+        return _SIGNAL_NAMES[signal_code(close, high, low, volume, w_short, w_long, w_swing, w_volume)]
 
-        if processed_data.empty:
-            logging.warning('Data became empty after dropping NaNs. Cannot generate signal.')
-            return 'HOLD'
+    def generate_signals_batch(self, data: pd.DataFrame) -> np.ndarray:
+        """
+        Generates a signal for every bar of the history in one vectorized pass.
+
+        Backtest counterpart to `generate_signal`: rather than re-slicing
+        the tail per bar (O(N * window) overall), the rolling indicators
+        are computed full-length once and the BUY/SELL conditions become
+        boolean masks combined with `np.where`. Warm-up bars carry NaN
+        indicators, fail every comparison and come out 0, matching the
+        per-bar path.
 
-        logging.info('Generating trading signal based on combined analysis...')
-        signal = 'HOLD'
+        Args:
+            data: A pandas DataFrame with 'close', 'high', 'low' and
+                  'volume' columns.
 
-        latest_data = processed_data.iloc[-1]
+        Returns:
+            An int8 array with one entry per bar: 1 for BUY, -1 for SELL,
+            0 for HOLD.
+        """
+        if data.empty:
+            logger.warning('Input data is empty. Cannot generate signals.')
+            return np.zeros(0, dtype=np.int8)
+        if not ('close' in data.columns and 'high' in data.columns and 'low' in data.columns and 'volume' in data.columns):
+            logger.warning('Required OHLCV columns not found. Cannot generate signals.')
+            return np.zeros(len(data), dtype=np.int8)
 
-        buy_condition_pvg = latest_data.get('PVG_SMA_Short', -1) > latest_data.get('PVG_SMA_Long', -1)
-        buy_condition_smc = latest_data.get('SMC_Swing_Low', 0) == 1
-        buy_condition_tpr = latest_data.get('close', 0) > latest_data.get('PVG_SMA_Long', 0) and latest_data.get('TPR_Volume_SMA', 0) > 0
+        close_s = data['close']
+        close = close_s.to_numpy(dtype=np.float64)
+        sma_short = close_s.rolling(window=self.pvg_short_period, min_periods=self.pvg_short_period).mean().to_numpy(dtype=np.float64)
+        sma_long = close_s.rolling(window=self.pvg_long_period, min_periods=self.pvg_long_period).mean().to_numpy(dtype=np.float64)
+        volume_sma = data['volume'].rolling(window=self.tpr_volume_period, min_periods=self.tpr_volume_period).mean().to_numpy(dtype=np.float64)
+        swing_high, swing_low = swing_flags(
+            data['high'].to_numpy(dtype=np.float64),
+            data['low'].to_numpy(dtype=np.float64),
+            self.smc_lookback,
+        )
 
+        volume_ok = volume_sma > 0
+        buy = (sma_short > sma_long) & (swing_low != 0) & (close > sma_long) & volume_ok
+        sell = (sma_short < sma_long) & (swing_high != 0) & (close < sma_long) & volume_ok
+        return np.where(buy, 1, np.where(sell, -1, 0)).astype(np.int8)
 
-        if buy_condition_pvg and buy_condition_smc and buy_condition_tpr:
-            signal = 'BUY'
-        else:
-            sell_condition_pvg = latest_data.get('PVG_SMA_Short', 1) < latest_data.get('PVG_SMA_Long', 1)
-            sell_condition_smc = latest_data.get('SMC_Swing_High', 0) == 1
-            sell_condition_tpr = latest_data.get('close', 0) < latest_data.get('PVG_SMA_Long', 0) and latest_data.get('TPR_Volume_SMA', 0) > 0
+    def generate_signal_incremental(self, bar: dict) -> str:
+        """
+        Generates a signal from a single new bar in O(1) time.
 
-            if sell_condition_pvg and sell_condition_smc and sell_condition_tpr:
-                 signal = 'SELL'
+        Streaming counterpart to `generate_signal`: instead of re-scanning
+        the history tail on every bar, each indicator carries incremental
+        window state that is updated in place. Feeding the same bars one by
+        one yields the same signals the batch path produces on the full
+        frame.
+
+        Args:
+            bar: A mapping with 'close', 'high', 'low' and 'volume' values
+                 for the newest bar.
+
+        Returns:
+            A string representing the trading signal ('BUY', 'SELL', or 'HOLD').
+        """
+        close = float(bar['close'])
+        sma_short = self._sma_short.update(close)
+        sma_long = self._sma_long.update(close)
+        volume_sma = self._volume_sma.update(float(bar['volume']))
+        swing_high = self._high_extreme.update(float(bar['high']))
+        swing_low = self._low_extreme.update(float(bar['low']))
+
+        if not self._sma_long.ready:
+            return 'HOLD'
+        if sma_short > sma_long and swing_low and close > sma_long and volume_sma > 0:
+            return 'BUY'
+        if sma_short < sma_long and swing_high and close < sma_long and volume_sma > 0:
+            return 'SELL'
+        return 'HOLD'
+
+    def generate_signal(self, data: pd.DataFrame) -> str:
+        """
+        Generates a trading signal (BUY, SELL, or HOLD) based on the combined analysis.
+        """
+        if data.empty:
+            logger.warning('Input data is empty. Cannot generate signal.')
+            return 'HOLD'
+        if not ('close' in data.columns and 'high' in data.columns and 'low' in data.columns and 'volume' in data.columns):
+            logger.warning('Required OHLCV columns not found. Cannot generate signal.')
+            return 'HOLD'
 
-        logging.info(f'Generated signal: {signal}')
-        return signal
+        close = data['close'].to_numpy(dtype=self._dtype)
+        high = data['high'].to_numpy(dtype=self._dtype)
+        low = data['low'].to_numpy(dtype=self._dtype)
+        volume = data['volume'].to_numpy(dtype=self._dtype)
+        return self._signal_from_arrays(close, high, low, volume)
@@ -309,3 +309,40 @@ class TestRiskManager(unittest.TestCase):
         self.risk_manager.reset_daily_loss()
         self.assertEqual(self.risk_manager.daily_loss_incurred, 0.0)
         self.assertEqual(self.risk_manager.initial_balance, current_balance)
+
+    def test_calculate_position_size_vec_matches_scalar(self):
+        """
+        Tests that the vectorized position sizing agrees with the scalar path,
+        including the invalid-input cases that return 0.
+        """
+        entries = np.array([100.0, 100.0, 100.0, 0.0])
+        stops = np.array([99.0, 101.0, 100.0, 10.0])
+        sizes = self.risk_manager.calculate_position_size_vec(entries, stops)
+        for i in range(len(entries)):
+            self.assertAlmostEqual(sizes[i], self.risk_manager.calculate_position_size(entries[i], stops[i]))
+
+    def test_determine_stop_loss_vec_matches_scalar(self):
+        """
+        Tests that the vectorized stop loss calculation agrees with the scalar
+        path for both the percentage and the volatility rules.
+        """
+        entries = np.array([100.0, 50.0, 1.0])
+        pct_stops = self.risk_manager.determine_stop_loss_vec(entries, stop_loss_distance_percentage=0.02)
+        for i in range(len(entries)):
+            self.assertAlmostEqual(pct_stops[i], self.risk_manager.determine_stop_loss(entries[i], stop_loss_distance_percentage=0.02))
+
+        vols = np.array([2.0, 1.0, 5.0])
+        vol_stops = self.risk_manager.determine_stop_loss_vec(entries, volatilities=vols)
+        for i in range(len(entries)):
+            self.assertAlmostEqual(vol_stops[i], self.risk_manager.determine_stop_loss(entries[i], volatility=vols[i]))
+
+    def test_determine_take_profit_vec_matches_scalar(self):
+        """
+        Tests that the vectorized take profit calculation agrees with the
+        scalar path for long and short positions.
+        """
+        entries = np.array([100.0, 100.0])
+        stops = np.array([98.0, 102.0])
+        targets = self.risk_manager.determine_take_profit_vec(entries, stops, 2.0)
+        for i in range(len(entries)):
+            self.assertAlmostEqual(targets[i], self.risk_manager.determine_take_profit(entries[i], stops[i], 2.0))
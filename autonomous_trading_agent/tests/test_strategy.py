@@ -7,6 +7,30 @@ class TestCombinedStrategy(unittest.TestCase):
     """
     Unit tests for the CombinedStrategy class.
     """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Build the invariant input frames once for the whole class. The
+        tests treat these as read-only; anything that needs to mutate a
+        frame takes its own copy.
+        """
+        data_points = 70
+        cls._hold_data = pd.DataFrame({
+            'open': np.full(data_points, 150),
+            'high': np.full(data_points, 152),
+            'low': np.full(data_points, 148),
+            'close': np.full(data_points, 150), # Sideways
+            'volume': np.full(data_points, 100)
+        })
+        cls._nan_data = pd.DataFrame({
+            'open': [10, 11, np.nan, 13, 14],
+            'high': [10.5, 11.5, 12.5, np.nan, 14.5],
+            'low': [9.5, 10.5, 11.5, 12.5, np.nan],
+            'close': [10, 11, 12, 13, 14],
+            'volume': [100, np.nan, 120, 130, 140]
+        })
+        cls._empty_data = pd.DataFrame()
+
     def setUp(self):
         """
         Set up test environment before each test method.
@@ -61,25 +85,73 @@ class TestCombinedStrategy(unittest.TestCase):
     def test_generate_signal_hold(self):
         """
         Tests if the strategy correctly generates a HOLD signal under simulated conditions (e.g., sideways market).
+        The signal path must not mutate the caller's frame, so the shared
+        fixture is passed straight in and checked afterwards.
         """
-        data_points = 70
+        original = self._hold_data.copy()
+        signal = self.strategy.generate_signal(self._hold_data)
+        self.assertEqual(signal, 'HOLD')
+        pd.testing.assert_frame_equal(self._hold_data, original)
+
+    def test_fp32_precision_mode(self):
+        """
+        Tests that the fp32 precision mode produces a valid signal and that
+        an unknown precision string is rejected.
+        """
+        strategy = CombinedStrategy(precision='fp32')
+        self.assertEqual(strategy.generate_signal(self._hold_data), 'HOLD')
+        with self.assertRaises(ValueError):
+            CombinedStrategy(precision='fp16')
+
+    def test_generate_signal_incremental_matches_batch(self):
+        """
+        Tests that feeding bars one by one through the incremental path
+        produces the same signal as the batch path on the growing history.
+        """
+        rng = np.random.default_rng(7)
+        data_points = 80
+        close = 150 + np.cumsum(rng.normal(0, 1, size=data_points))
         data = pd.DataFrame({
-            'open': np.full(data_points, 150),
-            'high': np.full(data_points, 152),
-            'low': np.full(data_points, 148),
-            'close': np.full(data_points, 150), # Sideways
-            'volume': np.full(data_points, 100)
+            'open': close - 0.2,
+            'high': close + rng.uniform(0.1, 1.0, size=data_points),
+            'low': close - rng.uniform(0.1, 1.0, size=data_points),
+            'close': close,
+            'volume': rng.integers(100, 1000, size=data_points).astype(float)
         })
 
-        signal = self.strategy.generate_signal(data.copy())
-        self.assertEqual(signal, 'HOLD')
+        self.strategy.reset_incremental_state()
+        for i in range(data_points):
+            incremental = self.strategy.generate_signal_incremental(data.iloc[i].to_dict())
+            batch = self.strategy.generate_signal(data.iloc[:i + 1])
+            self.assertEqual(incremental, batch)
+
+    def test_generate_signals_batch_matches_per_bar(self):
+        """
+        Tests that the vectorized whole-history signals agree with the
+        per-bar path evaluated on each growing prefix.
+        """
+        rng = np.random.default_rng(11)
+        data_points = 80
+        close = 150 + np.cumsum(rng.normal(0, 1, size=data_points))
+        data = pd.DataFrame({
+            'open': close - 0.2,
+            'high': close + rng.uniform(0.1, 1.0, size=data_points),
+            'low': close - rng.uniform(0.1, 1.0, size=data_points),
+            'close': close,
+            'volume': rng.integers(100, 1000, size=data_points).astype(float)
+        })
+
+        signals = self.strategy.generate_signals_batch(data)
+        self.assertEqual(signals.dtype, np.int8)
+        labels = {1: 'BUY', -1: 'SELL', 0: 'HOLD'}
+        for i in range(data_points):
+            self.assertEqual(labels[int(signals[i])], self.strategy.generate_signal(data.iloc[:i + 1]))
 
     def test_generate_signal_empty_data(self):
         """
         Tests if the strategy handles empty input data gracefully and returns HOLD.
         """
-        data = pd.DataFrame()
-        signal = self.strategy.generate_signal(data)
+        signal = self.strategy.generate_signal(self._empty_data)
         self.assertEqual(signal, 'HOLD')
 
     def test_generate_signal_data_with_nans(self):
@@ -87,12 +159,5 @@ class TestCombinedStrategy(unittest.TestCase):
         Tests if the strategy handles input data containing NaN values.
         Expects a 'HOLD' signal if critical data for the latest bar is missing after processing.
         """
-        data = pd.DataFrame({
-            'open': [10, 11, np.nan, 13, 14],
-            'high': [10.5, 11.5, 12.5, np.nan, 14.5],
-            'low': [9.5, 10.5, 11.5, 12.5, np.nan],
-            'close': [10, 11, 12, 13, 14],
-            'volume': [100, np.nan, 120, 130, 140]
-        })
-        signal = self.strategy.generate_signal(data.copy())
+        signal = self.strategy.generate_signal(self._nan_data)
         self.assertEqual(signal, 'HOLD')
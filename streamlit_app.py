@@ -1,18 +1,30 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
+import queue
+import threading
 import time
 import logging
 import sqlite3
+import sys
 import os
+from collections import deque
+import importlib
 from datetime import datetime, timedelta
 from autonomous_trading_agent.strategy.trading_strategy import CombinedStrategy
 from autonomous_trading_agent.risk_management.risk_manager import RiskManager
-from autonomous_trading_agent.broker_integration.alpaca_integration import AlpacaIntegration
-from autonomous_trading_agent.broker_integration.binance_integration import BinanceIntegration
-from autonomous_trading_agent.broker_integration.interactive_brokers_integration import InteractiveBrokersIntegration
-from autonomous_trading_agent.broker_integration.oanda_integration import OandaIntegration
-# Import other integrations as they are implemented
+# Broker integrations are imported lazily in _resolve_broker: each one can
+# drag in a heavy SDK, and eagerly loading all of them would tax every
+# cold start and code-reload even when only one broker is traded.
+
+# Use libuv's event loop for the async order/data paths when available; it
+# cuts per-syscall overhead well below the stdlib selector loop. Optional —
+# Linux/macOS only — so the app runs unchanged without it.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
 
 # --- App Configuration ---
 st.set_page_config(layout="wide", page_title="Titan Forge Algorithmic Agent")
@@ -26,6 +38,31 @@ load_css("static/style.css")
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Stable column order for the positions table; kept module-level so no
+# DataFrame machinery is involved while positions are accumulated.
+POSITION_COLUMNS = ('Symbol', 'Quantity', 'Side', 'Entry Price', 'Current Price', 'Unrealized P/L', 'Stop Loss', 'Take Profit', 'Entry Time')
+
+# Signal string -> numeric side, resolved once per signal so the price
+# math below is sign arithmetic instead of repeated string compares.
+_SIGNAL_SIDES = {'BUY': 1, 'SELL': -1, 'HOLD': 0}
+
+# Broker-name -> integration dispatch. A single place to extend as the
+# remaining integrations are implemented, instead of a growing if/elif
+# chain in _get_broker_integration. Values start as 'module:Class' import
+# strings and are replaced with the resolved class on first use.
+_BROKERS = {
+    'Alpaca': 'autonomous_trading_agent.broker_integration.alpaca_integration:AlpacaIntegration',
+}
+
+
+def _resolve_broker(broker_name):
+    target = _BROKERS.get(broker_name)
+    if isinstance(target, str):
+        module_name, cls_name = target.split(':')
+        target = getattr(importlib.import_module(module_name), cls_name)
+        _BROKERS[broker_name] = target
+    return target
+
 # --- Database Functions ---
 def init_db():
     os.makedirs('database', exist_ok=True)
@@ -65,9 +102,14 @@ if 'agent' not in st.session_state:
 if 'agent_status' not in st.session_state:
     st.session_state.agent_status = "Stopped"
 if 'logs' not in st.session_state:
-    st.session_state.logs = []
+    # Bounded deque: O(1) appendleft with automatic eviction of the
+    # oldest line, no shifting or length bookkeeping per log call.
+    st.session_state.logs = deque(maxlen=100)
 if 'positions' not in st.session_state:
-    st.session_state.positions = pd.DataFrame(columns=['Symbol', 'Quantity', 'Side', 'Entry Price', 'Current Price', 'Unrealized P/L', 'Stop Loss', 'Take Profit', 'Entry Time'])
+    # Open positions live as a plain list of dicts: appends and removals
+    # are O(1)/O(n) list operations, and a DataFrame is only materialized
+    # once per render for st.dataframe.
+    st.session_state.positions = []
 if 'account_balance' not in st.session_state:
     st.session_state.account_balance = 10000.0 # Default
 if 'keys_saved' not in st.session_state:
@@ -76,16 +118,50 @@ if 'keys_saved' not in st.session_state:
 # --- Helper Functions ---
 def add_log(message):
     timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-    st.session_state.logs.insert(0, f"[{timestamp}] {message}")
-    # Keep logs from getting too long
-    if len(st.session_state.logs) > 100:
-        st.session_state.logs.pop()
+    st.session_state.logs.appendleft(f"[{timestamp}] {message}")
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_bars(_broker, symbol, timeframe, start_iso, end_iso):
+    # The underscore keeps the broker instance out of the cache key; the
+    # request window is truncated to the minute by the caller, so within a
+    # minute the same (symbol, window) hits the cache instead of the API.
+    return _broker.fetch_historical_data(symbol, timeframe, start_iso, end_iso)
+
+@st.cache_data(show_spinner=False)
+def _calc_size(balance, risk_per_trade_pct, entry_price, stop_loss_price):
+    # Memoizes the sidebar calculator on its four scalar inputs, so reruns
+    # with unchanged widgets skip the RiskManager construction entirely.
+    risk_manager = RiskManager(
+        account_balance=balance,
+        risk_per_trade_percentage=risk_per_trade_pct / 100,
+        daily_risk_limit_percentage=0.05 # This is a placeholder, not used in calculation
+    )
+    return risk_manager.calculate_position_size(entry_price, stop_loss_price)
 
 # --- Core Agent Logic ---
 class TradingAgent:
     def __init__(self, config):
         self.config = config
         self.strategy = CombinedStrategy()
+        # Set by stop_agent (or the daily risk limit) to end the loop; the
+        # loop blocks on this instead of polling session state every second.
+        self._stop_event = threading.Event()
+        self._thread = None
+        # The loop runs on a background thread, so it must never touch
+        # st.session_state. It owns its positions list and pushes log lines
+        # through a queue; the UI fragments drain both on their own thread.
+        self._log_queue = queue.Queue()
+        self._positions = list(st.session_state.positions)
+        # Entry times mirrored as monotonic-clock floats, kept parallel to
+        # the positions list, so the time-based exit is one vectorized
+        # compare that is immune to wall-clock jumps. Positions surviving
+        # from a previous agent keep their age via the wall-clock delta.
+        now = datetime.now()
+        now_mono = time.monotonic()
+        self._entry_monos = np.array(
+            [now_mono - (now - p['Entry Time']).total_seconds() for p in self._positions],
+            dtype=np.float64,
+        )
         # Initialize broker integration
         self.broker = self._get_broker_integration(config)
 
@@ -100,64 +176,90 @@ class TradingAgent:
         )
         add_log("Agent initialized successfully.")
 
+    def _log(self, message):
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        self._log_queue.put(f"[{timestamp}] {message}")
+
     def _get_broker_integration(self, config):
         broker_name = config['broker']
         api_key = config.get('api_key')
         api_secret = config.get('api_secret')
 
-        if broker_name == 'Alpaca':
-            if not api_key or not api_secret:
-                raise ValueError("Alpaca API Key and Secret are required.")
-            return AlpacaIntegration(api_key=api_key, api_secret=api_secret)
-        else:
+        cls = _resolve_broker(broker_name)
+        if cls is None:
             add_log(f"Broker '{broker_name}' is not yet supported.")
             raise ValueError(f"Broker '{broker_name}' is not yet supported.")
+        if not api_key or not api_secret:
+            raise ValueError(f"{broker_name} API Key and Secret are required.")
+        return cls(api_key=api_key, api_secret=api_secret)
 
     def run_trading_loop(self):
-        add_log("Trading loop started.")
-
-        while st.session_state.agent_status == "Running":
+        self._log("Trading loop started.")
+        # Constant for the whole run; no need to rebuild it per iteration.
+        exit_seconds = self.config['time_based_exit'] * 60
+
+        while not self._stop_event.is_set():
+            # One clock read per iteration: the wall time feeds the fetch
+            # window and display fields, the monotonic stamp feeds the
+            # exit deadlines.
+            now = datetime.now()
+            now_mono = time.monotonic()
             for symbol in self.config['symbols']:
-                add_log(f"--- Processing symbol: {symbol} ---")
+                if self._stop_event.is_set():
+                    break
+                self._log(f"--- Processing symbol: {symbol} ---")
                 try:
                     # 1. Fetch Data
                     # For scalping, we fetch recent 1-minute data
-                    end_date = datetime.now()
+                    # Truncate the window to the minute: only the last
+                    # 1-minute bar can change, so every request within the
+                    # same minute shares a cache entry.
+                    end_date = now.replace(second=0, microsecond=0)
                     start_date = end_date - timedelta(days=3) # Fetch last 3 days of 1-minute data
                     # Note: Alpaca requires dates in ISO 8601 format
-                    historical_data = self.broker.fetch_historical_data(symbol, '1Min', start_date.isoformat(), end_date.isoformat())
+                    historical_data = _cached_bars(self.broker, symbol, '1Min', start_date.isoformat(), end_date.isoformat())
 
-                    if historical_data.empty:
-                        add_log(f"Could not fetch historical data for {symbol}.")
+                    # One shape read covers both the emptiness branch and
+                    # the log line; no .empty plus len() double dispatch.
+                    n_bars = historical_data.shape[0]
+                    if n_bars == 0:
+                        self._log(f"Could not fetch historical data for {symbol}.")
                         continue
 
-                    add_log(f"Fetched {len(historical_data)} data points for {symbol}.")
+                    self._log(f"Fetched {n_bars} data points for {symbol}.")
+
+                    # Raw close array hoisted once; zero-copy for float64
+                    # columns, and the latest price comes straight off it
+                    # instead of through a Series/iloc round trip.
+                    close_arr = historical_data['close'].to_numpy(dtype=np.float64)
 
                     # 2. Generate Signal
                     signal = self.strategy.generate_signal(historical_data)
-                    add_log(f"Signal for {symbol}: {signal}")
+                    self._log(f"Signal for {symbol}: {signal}")
 
                     # 3. Act on Signal
                     # This is a simplified logic. A real agent would manage existing positions.
-                    if signal == 'BUY' or signal == 'SELL':
+                    side = _SIGNAL_SIDES[signal]
+                    if side:
                         if not self.risk_manager.check_daily_risk_limit():
-                            add_log("Daily risk limit reached. Halting trades for the day.")
-                            st.session_state.agent_status = "Stopped"
+                            self._log("Daily risk limit reached. Halting trades for the day.")
+                            self._stop_event.set()
                             break
 
                         # Simplified execution logic
-                        entry_price = historical_data['close'].iloc[-1]
+                        entry_price = float(close_arr[-1])
                         # Example: stop loss is 2% below/above entry
-                        stop_loss_price = entry_price * 0.98 if signal == 'BUY' else entry_price * 1.02
+                        stop_loss_price = entry_price * (1.0 - 0.02 * side)
 
                         position_size = self.risk_manager.calculate_position_size(entry_price, stop_loss_price)
                         take_profit_price = self.risk_manager.determine_take_profit(entry_price, stop_loss_price, self.config['risk_reward_ratio'])
 
                         if position_size > 0:
-                            add_log(f"Executing {signal} for {position_size:.2f} shares of {symbol} at {entry_price:.2f}, SL: {stop_loss_price:.2f}, TP: {take_profit_price:.2f}")
+                            self._log(f"Executing {signal} for {position_size:.2f} shares of {symbol} at {entry_price:.2f}, SL: {stop_loss_price:.2f}, TP: {take_profit_price:.2f}")
                             # In a real app, you'd call self.broker.place_order(...)
                             # For this simulation, we'll just log it and add to positions
-                            new_position = pd.DataFrame([{
+                            self._entry_monos = np.append(self._entry_monos, now_mono)
+                            self._positions.append({
                                 'Symbol': symbol,
                                 'Quantity': position_size,
                                 'Side': signal,
@@ -166,45 +268,45 @@ class TradingAgent:
                                 'Unrealized P/L': 0.0,
                                 'Stop Loss': stop_loss_price,
                                 'Take Profit': take_profit_price,
-                                'Entry Time': datetime.now()
-                            }])
-                            st.session_state.positions = pd.concat([st.session_state.positions, new_position], ignore_index=True)
+                                'Entry Time': now
+                            })
 
                 except Exception as e:
-                    add_log(f"An error occurred while processing {symbol}: {e}")
+                    self._log(f"An error occurred while processing {symbol}: {e}")
 
             # --- Time-based Exit Logic ---
-            if not st.session_state.positions.empty:
-                positions_to_close = []
-                for index, position in st.session_state.positions.iterrows():
-                    entry_time = position['Entry Time']
-                    if (datetime.now() - entry_time) > timedelta(minutes=self.config['time_based_exit']):
-                        positions_to_close.append(index)
-                        add_log(f"Closing position for {position['Symbol']} due to time-based exit.")
-
-                if positions_to_close:
+            if self._positions:
+                stale = (time.monotonic() - self._entry_monos) > exit_seconds
+                if stale.any():
+                    positions_to_close = [p for p, s in zip(self._positions, stale) if s]
+                    still_open = [p for p, s in zip(self._positions, stale) if not s]
+                    for position in positions_to_close:
+                        self._log(f"Closing position for {position['Symbol']} due to time-based exit.")
                     if hasattr(self.broker, 'get_current_price'):
-                        for index in positions_to_close:
-                            position = st.session_state.positions.loc[index]
+                        for position in positions_to_close:
                             exit_price = self.broker.get_current_price(position['Symbol'])
                             pnl = (exit_price - position['Entry Price']) * position['Quantity'] if position['Side'] == 'BUY' else (position['Entry Price'] - exit_price) * position['Quantity']
-                            log_trade(position['Symbol'], position['Quantity'], position['Side'], position['Entry Price'], exit_price, pnl, position['Entry Time'], datetime.now())
+                            log_trade(position['Symbol'], position['Quantity'], position['Side'], position['Entry Price'], exit_price, pnl, position['Entry Time'], datetime.now())  # fresh stamp: user-visible exit time
                     else:
-                        add_log(f"Broker '{self.config['broker']}' does not support real-time price fetching. Trade history will not be logged.")
-                    st.session_state.positions = st.session_state.positions.drop(positions_to_close).reset_index(drop=True)
+                        self._log(f"Broker '{self.config['broker']}' does not support real-time price fetching. Trade history will not be logged.")
+                    self._positions = still_open
+                    self._entry_monos = self._entry_monos[~stale]
 
 
-            if st.session_state.agent_status != "Running":
+            if self._stop_event.is_set():
                 break
 
-            add_log("Loop finished. Waiting for next iteration...")
-            # In a real app, you'd have a proper scheduler. Here we just sleep.
-            # We also need to yield control to Streamlit to update the UI.
-            for i in range(60):
-                if st.session_state.agent_status != "Running": break
-                time.sleep(1)
+            self._log("Loop finished. Waiting for next iteration...")
+            # Block on the stop event until just past the next wall-clock
+            # minute boundary, when a fresh 1-minute bar exists — rather
+            # than a flat 60s from an arbitrary phase. A stop request still
+            # ends the wait immediately.
+            remaining = 60.0 - (time.time() % 60.0)
+            if remaining < 1.0:
+                remaining += 60.0
+            self._stop_event.wait(timeout=remaining)
 
-        add_log("Trading loop has been terminated.")
+        self._log("Trading loop has been terminated.")
 
 # --- UI Callbacks ---
 def save_keys():
@@ -227,7 +329,9 @@ def start_agent():
         "broker": st.session_state.broker_select,
         "api_key": st.session_state.api_key,
         "api_secret": st.session_state.api_secret,
-        "symbols": [s.strip().upper() for s in st.session_state.symbols.split(',')],
+        # Frozen tuple of interned symbols: split once here, and symbol
+        # comparisons downstream reduce to pointer equality.
+        "symbols": tuple(sys.intern(s.strip().upper()) for s in st.session_state.symbols.split(',')),
         "initial_balance": st.session_state.initial_balance,
         "risk_per_trade": st.session_state.risk_per_trade,
         "risk_reward_ratio": st.session_state.risk_reward_ratio,
@@ -235,18 +339,43 @@ def start_agent():
     }
 
     try:
-        st.session_state.agent = TradingAgent(config)
-        # This is a simplified way to run the loop. A robust app might use threading.
-        st.session_state.agent.run_trading_loop()
+        agent = TradingAgent(config)
+        st.session_state.agent = agent
+        # The loop runs on its own daemon thread so the script thread stays
+        # free to render; the stop event ends it.
+        agent._thread = threading.Thread(target=agent.run_trading_loop, daemon=True)
+        agent._thread.start()
     except Exception as e:
         add_log(f"Failed to start agent: {e}")
         st.session_state.agent_status = "Stopped"
 
 def stop_agent():
     st.session_state.agent_status = "Stopped"
+    agent = st.session_state.agent
+    if agent is not None:
+        agent._stop_event.set()
+        _sync_agent_state()
     st.session_state.agent = None
     add_log("User requested to stop the agent.")
 
+def _sync_agent_state():
+    """Drains the trading thread's log queue and mirrors its positions
+    into session state. Runs on the script thread only."""
+    agent = st.session_state.agent
+    if agent is None:
+        return
+    try:
+        while True:
+            st.session_state.logs.appendleft(agent._log_queue.get_nowait())
+    except queue.Empty:
+        pass
+    # One grouped write per sync instead of an attribute set per field;
+    # the log deque is mutated in place and needs no rebinding.
+    updates = {'positions': agent._positions}
+    if agent._stop_event.is_set():
+        updates['agent_status'] = "Stopped"
+    st.session_state.update(**updates)
+
 # --- UI Layout ---
 st.title("⚡ Titan Forge Algorithmic Agent")
 st.caption("Supporting Python + SQL + CSS + Shell")
@@ -283,15 +412,10 @@ with st.sidebar:
 
     st.subheader("Position Size Calculator")
     try:
-        temp_risk_manager = RiskManager(
-            account_balance=st.session_state.initial_balance,
-            risk_per_trade_percentage=st.session_state.risk_per_trade / 100,
-            daily_risk_limit_percentage=0.05 # This is a placeholder, not used in calculation
-        )
         entry_price_calc = st.number_input("Hypothetical Entry Price", min_value=0.01, value=100.0, step=1.0, key='entry_price_calc')
         stop_loss_calc = st.number_input("Hypothetical Stop Loss Price", min_value=0.01, value=98.0, step=1.0, key='stop_loss_calc')
 
-        calculated_size = temp_risk_manager.calculate_position_size(entry_price_calc, stop_loss_calc)
+        calculated_size = _calc_size(st.session_state.initial_balance, st.session_state.risk_per_trade, entry_price_calc, stop_loss_calc)
 
         st.metric("Calculated Position Size (shares)", f"{calculated_size:.2f}")
         st.caption(f"Based on {st.session_state.risk_per_trade}% risk on an account of ${st.session_state.initial_balance:,.2f}.")
@@ -342,15 +466,30 @@ with col1:
             st.metric("Current Equity", f"${st.session_state.account_balance:,.2f}", f"{(st.session_state.account_balance - initial_balance):.2f}")
 
     # --- Current Positions Card ---
-    with st.container(border=True):
+    # Live widgets re-run as throttled fragments: only this panel refreshes
+    # every two seconds, not the whole script with its sidebar and DB reads.
+    @st.fragment(run_every="2s")
+    def _positions_panel():
+        _sync_agent_state()
         st.subheader("📊 Current Positions")
-        st.dataframe(st.session_state.positions, use_container_width=True)
+        st.metric("Current Equity", f"${st.session_state.account_balance:,.2f}")
+        st.dataframe(pd.DataFrame(st.session_state.positions, columns=list(POSITION_COLUMNS)), use_container_width=True)
+
+    with st.container(border=True):
+        _positions_panel()
 
 with col2:
     # --- Recent Decisions Card ---
-    with st.container(border=True):
+    @st.fragment(run_every="2s")
+    def _activity_panel():
+        _sync_agent_state()
         st.subheader("🧠 Recent Decisions")
-        st.text_area("Activity Log", value="\n".join(st.session_state.logs), height=400, key="log_output")
+        # st.code renders a plain read-only scrollback; unlike st.text_area
+        # there is no editable-widget state to diff and serialize per rerun.
+        st.code("\n".join(st.session_state.logs), language=None, height=400)
+
+    with st.container(border=True):
+        _activity_panel()
 
     # --- Trade History Card ---
     with st.container(border=True):
@@ -363,8 +502,3 @@ with col2:
             st.error(f"Could not load trade history: {e}")
         finally:
             conn.close()
-
-# This is a hack to make the log update more frequently on screen
-if st.session_state.agent_status == "Running":
-    time.sleep(1)
-    st.rerun()